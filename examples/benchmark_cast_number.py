@@ -0,0 +1,39 @@
+# Compare the generic `cast_number` with the caster compiled by a number field
+# python examples/benchmark_cast_number.py [count]
+import sys
+import time
+import random
+from functools import partial
+from itertools import cycle, islice
+from tableschema import types
+
+# Values
+COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+random.seed(0)
+VALUES = {
+    'plain': ['%.4f' % random.uniform(-1e6, 1e6) for _ in range(1000)],
+    'grouped': ['{:,.2f}'.format(random.uniform(-1e6, 1e6)) for _ in range(1000)],
+}
+OPTIONS = {
+    'plain': {},
+    'grouped': {'groupChar': ','},
+    'european': {'groupChar': '.', 'decimalChar': ','},
+    'plain/float': {'floatNumber': True},
+}
+VALUES['european'] = [value.replace(',', ' ').replace('.', ',').replace(' ', '.')
+                      for value in VALUES['grouped']]
+VALUES['plain/float'] = VALUES['plain']
+
+# Benchmark
+def run(cast, values):
+    start = time.time()
+    for value in islice(cycle(values), COUNT):
+        cast(value)
+    return time.time() - start
+
+print('%s values' % COUNT)
+for name, options in OPTIONS.items():
+    generic = run(partial(types.cast_number, 'default', **options), VALUES[name])
+    compiled = run(types.compile_number('default', **options), VALUES[name])
+    print('%-12s generic %6.2fs  compiled %6.2fs  x%.1f' % (
+        name, generic, compiled, generic / compiled))
@@ -0,0 +1,34 @@
+# Compare list and set lookups of missing values and enum constraints
+# python examples/benchmark_membership.py [count]
+import sys
+import time
+from functools import partial
+from itertools import cycle, islice
+from tableschema import Field, helpers
+from tableschema.constraints import check_enum
+
+# Values
+COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+ENUM = ['code%s' % index for index in range(2000)]
+MISSING_VALUES = ['', 'NA', 'N/A', 'n/a', 'null', 'NULL', 'None', '-', '--',
+                  '?', 'missing', 'unknown', 'nan', 'NaN', '#N/A']
+VALUES = ENUM[::7] + MISSING_VALUES
+
+# Benchmark
+def run(function):
+    start = time.time()
+    for value in islice(cycle(VALUES), COUNT):
+        function(value)
+    return time.time() - start
+
+print('%s values, %s enum values, %s missing values' % (
+    COUNT, len(ENUM), len(MISSING_VALUES)))
+print('missing   list %6.2fs  set %6.2fs' % (
+    run(MISSING_VALUES.__contains__),
+    run(frozenset(MISSING_VALUES).__contains__)))
+print('enum      list %6.2fs  set %6.2fs' % (
+    run(partial(check_enum, ENUM)),
+    run(partial(check_enum, helpers.ValueSet(ENUM)))))
+field = Field({'name': 'code', 'type': 'string', 'constraints': {'enum': ENUM}},
+              missing_values=MISSING_VALUES)
+print('field     cast_value %6.2fs' % run(field.cast_value))
@@ -51,7 +51,7 @@ setup(
     include_package_data=True,
     install_requires=INSTALL_REQUIRES,
     tests_require=TESTS_REQUIRE,
-    extras_require={'develop': TESTS_REQUIRE},
+    extras_require={'develop': TESTS_REQUIRE, 'numpy': ['numpy']},
     entry_points={
         'console_scripts': [
             'tableschema = tableschema.__main__:cli',
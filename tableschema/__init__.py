@@ -14,9 +14,12 @@ from .table import Table
 from .schema import Schema
 from .field import Field
 from .storage import Storage
+from .index import ForeignKeyIndex
 from .validate import validate
+from .validate import validate_tables
 from .infer import infer
 from .schema import FailedCast
+from .schema import InferenceState
 from .exceptions import DataPackageException
 from .exceptions import TableSchemaException
 from .exceptions import LoadError
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import six
+from decimal import Decimal
+from .. import exceptions
+from .. import config
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Module API
+
+def cast_many(field, values):
+    """Cast values for the field using NumPy
+
+    String values are cast by chunk-wide NumPy operations. Values not
+    handled by the fast path (missing values, non-strings, unusual shapes,
+    invalid values) are cast by the field's scalar functions so the result
+    and errors are the same as for `field.cast_many`.
+
+    # Arguments
+        field (Field): field to cast values against
+        values (any[]): values to cast
+
+    # Raises
+        TableSchemaException: if NumPy is not installed
+
+    # Returns
+        (any[], dict): cast values and a dictionary of cast errors by index
+
+    """
+    if numpy is None:
+        message = 'Backend "numpy" requires "numpy" package to be installed'
+        raise exceptions.TableSchemaException(message)
+
+    # Cast values (fast path)
+    result = list(values)
+    fast = numpy.zeros(len(values), dtype=bool)
+    cast = _CAST_FUNCTIONS.get(field.type)
+    if cast:
+        missing_values = set(field.missing_values)
+        indexes = [index for index, value in enumerate(values)
+            if isinstance(value, six.string_types) and value not in missing_values]
+        strings = [values[index] for index in indexes]
+        # NumPy strips trailing null characters so such values are skipped
+        if '\x00' in ''.join(strings):
+            indexes = [index for index, value in zip(indexes, strings)
+                if not value.endswith('\x00')]
+            strings = [values[index] for index in indexes]
+        if indexes:
+            try:
+                mask, cast_values = cast(field, numpy.array(strings))
+            except (ValueError, TypeError, OverflowError):
+                mask, cast_values = None, []
+            if mask is not None:
+                indexes = numpy.array(indexes)[mask]
+                fast[indexes] = True
+                for index, cast_value in zip(indexes.tolist(), cast_values):
+                    result[index] = cast_value
+
+    # Check values
+    checks = list(field.check_functions.values())
+    if checks:
+        for index in numpy.flatnonzero(fast).tolist():
+            cast_value = result[index]
+            for check in checks:
+                if not check(cast_value):
+                    fast[index] = False
+                    break
+
+    # Cast values (fallback to scalar functions)
+    errors = {}
+    compiled_cast_function = field.compiled_cast_function
+    for index in numpy.flatnonzero(~fast).tolist():
+        try:
+            result[index] = compiled_cast_function(values[index])
+        except exceptions.CastError as exception:
+            result[index] = values[index]
+            errors[index] = exception
+
+    return result, errors
+
+
+# Internal
+
+def _cast_number(field, array):
+    if field.format != 'default':
+        return None, []
+    for key in ['decimalChar', 'groupChar', 'bareNumber']:
+        if key in field.descriptor:
+            return None, []
+    unsigned = _strip_sign(array)
+    mask = numpy.char.isdecimal(numpy.char.replace(unsigned, '.', '', 1))
+    if field.descriptor.get('floatNumber'):
+        return mask, array[mask].astype(numpy.float64).tolist()
+    # Decimal is kept for the sake of exactness; NumPy only validates in bulk
+    return mask, [Decimal(value) for value in array[mask].tolist()]
+
+
+def _cast_boolean(field, array):
+    # Every distinct value is cast only once
+    values, inverse = numpy.unique(array, return_inverse=True)
+    cast_values = numpy.array(
+        [field.cast_function(value) for value in values.tolist()], dtype=object)
+    cast_values = cast_values[inverse.reshape(-1)]
+    mask = cast_values != config.ERROR
+    return mask, cast_values[mask].tolist()
+
+
+def _cast_date(field, array):
+    if field.format != 'default':
+        return None, []
+    mask = ((numpy.char.str_len(array) == 10) &
+        (numpy.char.find(array, '-') == 4) &
+        (numpy.char.rfind(array, '-') == 7) &
+        numpy.char.isdecimal(numpy.char.replace(array, '-', '')) &
+        (array >= '0001'))
+    return mask, array[mask].astype('datetime64[D]').astype(object).tolist()
+
+
+def _cast_datetime(field, array):
+    if field.format != 'default':
+        return None, []
+    mask = ((numpy.char.str_len(array) == 20) &
+        (numpy.char.find(array, '-') == 4) &
+        (numpy.char.rfind(array, '-') == 7) &
+        (numpy.char.find(array, 'T') == 10) &
+        (numpy.char.find(array, ':') == 13) &
+        (numpy.char.rfind(array, ':') == 16) &
+        (numpy.char.find(array, 'Z') == 19) &
+        numpy.char.isdecimal(_remove_chars(array, '-T:Z')) &
+        (array >= '0001'))
+    # The trailing "Z" is cut off by the fixed width type
+    array = array[mask].astype('U19')
+    return mask, array.astype('datetime64[s]').astype(object).tolist()
+
+
+def _strip_sign(array):
+    unsigned = numpy.char.lstrip(array, '+-')
+    mask = numpy.char.str_len(array) - numpy.char.str_len(unsigned) <= 1
+    return numpy.where(mask, unsigned, '')
+
+
+def _remove_chars(array, chars):
+    for char in chars:
+        array = numpy.char.replace(array, char, '')
+    return array
+
+
+# Integer values are not listed as the scalar `int` based cast
+# is faster than NumPy's string to int64 conversion
+_CAST_FUNCTIONS = {
+    'number': _cast_number,
+    'boolean': _cast_boolean,
+    'date': _cast_date,
+    'datetime': _cast_datetime,
+}
@@ -24,9 +24,10 @@ def cli():
       --help  Show this message and exit.
 
     Commands:
-      infer     Infer a schema from data.
-      info      Return info on this version of Table Schema
-      validate  Validate that a supposed schema is in fact a Table Schema.
+      infer            Infer a schema from data.
+      info             Return info on this version of Table Schema
+      validate         Validate that a supposed schema is in fact a Table Schema.
+      validate-tables  Validate data tables against their schemas.
     ```
 
     """
@@ -46,7 +47,8 @@ def info():
 @click.option('--encoding', default='utf-8')
 @click.option('--to_file')
 @click.option('--json', is_flag=True)
-def infer(data, row_limit, confidence, encoding, to_file, json):
+@click.option('--infer_constraints', is_flag=True)
+def infer(data, row_limit, confidence, encoding, to_file, json, infer_constraints):
     """Infer a schema from data.
 
     - data must be a local filepath
@@ -55,11 +57,13 @@ def infer(data, row_limit, confidence, encoding, to_file, json):
       with --encoding
     - the first line of data must be headers
     - these constraints are just for the CLI
+    - with --infer_constraints field constraints are suggested as well
 
     """
     try:
         descriptor = tableschema.infer(
-            data, encoding=encoding, limit=row_limit, confidence=confidence)
+            data, encoding=encoding, limit=row_limit, confidence=confidence,
+            infer_constraints=infer_constraints)
     except Exception as exception:
         click.echo(exception)
         sys.exit(1)
@@ -87,3 +91,33 @@ def validate(schema):
     except Exception as exception:
         click.echo(exception)
         sys.exit(1)
+
+
+@cli.command(name='validate-tables')
+@click.argument('manifest')
+@click.option('--workers', type=int)
+@click.option('--encoding')
+def validate_tables(manifest, workers, encoding):
+    """Validate data tables against their schemas.
+
+    - manifest must be a local JSON file containing a list
+      of `[source, schema]` pairs
+    - tables are validated in parallel using a pool of `--workers` processes
+    - a JSON report is printed (one per line) as soon as a table is validated
+
+    """
+    try:
+        with io.open(manifest, encoding='utf-8') as file:
+            tables = json_module.load(file)
+    except Exception as exception:
+        click.echo(exception)
+        sys.exit(1)
+
+    options = {}
+    if encoding:
+        options['encoding'] = encoding
+    valid = True
+    for report in tableschema.validate_tables(tables, workers=workers, **options):
+        valid = valid and report['valid']
+        click.echo(json_module.dumps(report, ensure_ascii=False))
+    sys.exit(0 if valid else 1)
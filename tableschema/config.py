@@ -15,4 +15,11 @@ ERROR = 'tableschema.error'
 DEFAULT_FIELD_TYPE = 'string'
 DEFAULT_FIELD_FORMAT = 'default'
 DEFAULT_MISSING_VALUES = ['']
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_UNIQUE_BUFFER_SIZE = 1000000
+DEFAULT_BLOOM_CAPACITY = 10000000
+DEFAULT_BLOOM_ERROR_RATE = 0.001
+DEFAULT_BLOOM_SUSPECTS_SIZE = 1000000
+DEFAULT_CAST_CACHE_MIN_HIT_RATE = 0.25
+DEFAULT_DICTIONARY_SIZE = 10000
 REMOTE_SCHEMES = ['http', 'https', 'ftp', 'ftps', 's3']
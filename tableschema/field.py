@@ -5,7 +5,9 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 import os
-from functools import partial
+import six
+from functools import partial, lru_cache
+from importlib import import_module
 from cached_property import cached_property
 from .profile import Profile
 from . import constraints
@@ -23,6 +25,13 @@ class Field(object):
     # Arguments
         descriptor (dict): schema field descriptor
         missingValues (str[]): an array with string representing missing values
+        cache_size (int):
+            if provided, results of casting string values (cast values
+            and cast errors) are kept in a LRU cache of this size so repeated
+            values are cast only once; when the cache is full and its hit rate
+            falls below `config.DEFAULT_CAST_CACHE_MIN_HIT_RATE`
+            it's disabled. Not used for object, array, geojson
+            and geopoint fields as their values are mutable
 
     # Raises
         TableSchemaException: raises any error that occurs during the process
@@ -34,6 +43,7 @@ class Field(object):
     ERROR = config.ERROR
 
     def __init__(self, descriptor, missing_values=config.DEFAULT_MISSING_VALUES,
+                 cache_size=None,
                  # Internal
                  schema=None):
 
@@ -43,10 +53,19 @@ class Field(object):
         # Set attributes
         self.__descriptor = descriptor
         self.__missing_values = missing_values
+        try:
+            self.__missing_values_set = frozenset(missing_values)
+        except TypeError:
+            self.__missing_values_set = None
         self.__schema = schema
+        self.__preserve_missing_values = os.environ.get('TABLESCHEMA_PRESERVE_MISSING_VALUES')
+        self.__cast_cache = None
         self.__cast_function = self.__get_cast_function()
         self.__check_functions = self.__get_check_functions()
-        self.__preserve_missing_values = os.environ.get('TABLESCHEMA_PRESERVE_MISSING_VALUES')
+        self.__compiled_cast_function = self.__get_compiled_cast_function()
+        if cache_size and self.type not in _MUTABLE_TYPES:
+            self.__cast_cache = _CastCache(self.__compiled_cast_function, cache_size)
+            self.__compiled_cast_function = self.__get_cached_cast_function()
 
     @cached_property
     def schema(self):
@@ -136,6 +155,10 @@ class Field(object):
     def check_functions(self):
         return self.__check_functions
 
+    @cached_property
+    def compiled_cast_function(self):
+        return self.__compiled_cast_function
+
     def cast_value(self, value, constraints=True):
         """Cast given value according to the field type and format.
 
@@ -153,8 +176,95 @@ class Field(object):
 
         """
 
-        # Null value
-        if value in self.__missing_values:
+        # Cached value
+        cache = self.__cast_cache
+        if (cache is not None and constraints is True and
+                isinstance(value, six.string_types) and cache.enabled):
+            return cache.cast(value)
+
+        return self.__cast_value(value, constraints)
+
+    def cast_many(self, values, constraints=True, backend=None):
+        """Cast a list of values (e.g. a table column) at once.
+
+        It's a batch version of `field.cast_value` which doesn't raise
+        on cast errors but collects them by value index instead.
+
+        # Arguments
+            values (any[]): values to cast against field
+            constraints (bool/str[]): constraints configuration
+            backend (str): optional casting backend e.g. `numpy` (vectorized
+                casting of the whole list); it's used only if all the
+                constraints are checked
+
+        # Raises
+            TableSchemaException: raises if the backend is not available
+
+        # Returns
+            (any[], dict): returns cast values and a dictionary of cast errors
+                in a form of `{index\\: CastError}`; values failed to cast
+                are returned as they are
+
+        """
+
+        # Cast values (backend)
+        if backend and constraints is True:
+            try:
+                module = import_module('tableschema.backends.%s' % backend)
+            except ImportError:
+                message = 'Not supported casting backend: %s' % backend
+                raise exceptions.TableSchemaException(message)
+            return module.cast_many(self, values)
+
+        # Prepare cast
+        cast = self.__compiled_cast_function
+        if constraints is not True:
+            cast = partial(self.cast_value, constraints=constraints)
+
+        # Cast values (fast path)
+        try:
+            return [cast(value) for value in values], {}
+        except exceptions.CastError:
+            pass
+
+        # Cast values
+        result = []
+        errors = {}
+        for index, value in enumerate(values):
+            try:
+                result.append(cast(value))
+            except exceptions.CastError as exception:
+                result.append(value)
+                errors[index] = exception
+
+        return result, errors
+
+    def test_value(self, value, constraints=True):
+        """Test whether value is compliant to the field.
+
+        # Arguments
+            value (any): value to cast against field
+            constraints (bool/str[]): constraints configuration
+
+        # Returns
+            bool: returns if value is compliant to the field
+
+        """
+        try:
+            self.cast_value(value, constraints=constraints)
+        except exceptions.CastError:
+            return False
+        return True
+
+    # Private
+
+    def __cast_value(self, value, constraints):
+        # Null value (unhashable values are looked up in the list)
+        try:
+            is_missing = value in self.__missing_values_set
+        except TypeError:
+            is_missing = value in self.__missing_values
+        if is_missing:
             # Whether missing_values should be preserved without being cast
             if self.__preserve_missing_values:
                 return value
@@ -185,29 +295,11 @@ class Field(object):
 
         return cast_value
 
-    def test_value(self, value, constraints=True):
-        """Test whether value is compliant to the field.
-
-        # Arguments
-            value (any): value to cast against field
-            constraints (bool/str[]): constraints configuration
-
-        # Returns
-            bool: returns if value is compliant to the field
-
-        """
-        try:
-            self.cast_value(value, constraints=constraints)
-        except exceptions.CastError:
-            return False
-        return True
-
-    # Private
-
     def __get_cast_function(self):
         options = {}
         # Get cast options
-        for key in ['decimalChar', 'groupChar', 'bareNumber', 'trueValues', 'falseValues']:
+        for key in ['decimalChar', 'groupChar', 'bareNumber', 'floatNumber',
+                    'trueValues', 'falseValues']:
             value = self.descriptor.get(key)
             if value is not None:
                 options[key] = value
@@ -216,6 +308,10 @@ class Field(object):
         except AttributeError:
             message = 'Not supported field type: %s' % self.type
             raise exceptions.TableSchemaException(message)
+        # Some types compile their format once (e.g. date patterns)
+        compile = getattr(types, 'compile_%s' % self.type, None)
+        if compile is not None:
+            return compile(self.format, **options)
         cast = partial(cast, self.format, **options)
         return cast
 
@@ -227,7 +323,7 @@ class Field(object):
             if name in whitelist:
                 # Cast enum constraint
                 if name in ['enum']:
-                    constraint = list(map(cast, constraint))
+                    constraint = helpers.ValueSet(map(cast, constraint))
                 # Cast maximum/minimum constraint
                 if name in ['maximum', 'minimum']:
                     constraint = cast(constraint)
@@ -235,9 +331,92 @@ class Field(object):
                 checks[name] = partial(check, constraint)
         return checks
 
+    def __get_compiled_cast_function(self):
+        # The same as `cast_value(value)` with all the field's state bound
+        # in advance; on any failure it delegates to `cast_value` to raise
+        cast = self.__cast_function
+        checks = list(self.__check_functions.values())
+        missing_values = self.__missing_values
+        missing_values_set = self.__missing_values_set
+        preserve_missing_values = self.__preserve_missing_values
+        cast_value = partial(self.__cast_value, constraints=True)
+        error = config.ERROR
+
+        def compiled_cast_function(value):
+            try:
+                is_missing = value in missing_values_set
+            except TypeError:
+                is_missing = value in missing_values
+            if is_missing:
+                if preserve_missing_values:
+                    return value
+                value = None
+            result = value
+            if value is not None:
+                result = cast(value)
+                if result == error:
+                    return cast_value(value)
+            for check in checks:
+                if not check(result):
+                    return cast_value(value)
+            return result
+
+        return compiled_cast_function
+
+    def __get_cached_cast_function(self):
+        cache = self.__cast_cache
+        compiled_cast_function = self.__compiled_cast_function
+        string_types = six.string_types
+
+        def cached_cast_function(value):
+            if cache.enabled and isinstance(value, string_types):
+                return cache.cast(value)
+            return compiled_cast_function(value)
+
+        return cached_cast_function
+
 
 # Internal
 
+_MUTABLE_TYPES = ['object', 'array', 'geojson', 'geopoint']
+
+
+class _CastCache(object):
+
+    # LRU cache of casting results (the hit rate is checked
+    # every `size` misses after the cache is full)
+
+    def __init__(self, cast_function, size,
+                 min_hit_rate=config.DEFAULT_CAST_CACHE_MIN_HIT_RATE):
+        self.enabled = True
+        self.__cast_function = cast_function
+        self.__size = size
+        self.__min_hit_rate = min_hit_rate
+        self.__misses = 0
+        self.__hits = 0
+        self.__cached_cast = lru_cache(maxsize=size)(self.__cast)
+
+    def cast(self, value):
+        result, exception = self.__cached_cast(value)
+        if exception is not None:
+            raise exception.with_traceback(None)
+        return result
+
+    def __cast(self, value):
+        self.__misses += 1
+        if self.__misses > self.__size and not self.__misses % self.__size:
+            hits = self.__cached_cast.cache_info().hits
+            hit_rate = (hits - self.__hits) / (hits - self.__hits + self.__size)
+            self.__hits = hits
+            if hit_rate < self.__min_hit_rate:
+                self.enabled = False
+                self.__cached_cast.cache_clear()
+        try:
+            return self.__cast_function(value), None
+        except exceptions.CastError as exception:
+            return None, exception
+
+
 def _get_field_constraints(type):
     # Extract list of constraints for given type from jsonschema
     jsonschema = Profile('table-schema').jsonschema
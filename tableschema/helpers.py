@@ -6,11 +6,13 @@ from __future__ import unicode_literals
 
 import os
 import io
+import re
 import sys
 import six
 import json
 import requests
 from copy import deepcopy
+from datetime import datetime
 from importlib.util import find_spec
 from . import exceptions
 from . import config
@@ -90,6 +92,173 @@ def default_exc_handler(exc, *args, **kwargs):
     raise exc
 
 
+def create_datetime_parser(pattern):
+    """Create a parser for a `datetime.strptime` pattern.
+
+    The pattern is compiled once to the regular expression `strptime` would
+    use and matched values are converted directly, so values are parsed
+    the same way without `strptime`'s per-call pattern handling and lock.
+    Patterns with other directives than `%Y %y %m %d %H %M %S %f %%`
+    are parsed by `strptime` itself. For ISO 8601 patterns (e.g. `%Y-%m-%d`)
+    zero-padded values are parsed by `datetime.fromisoformat` first.
+
+    Args:
+        pattern(str): strptime pattern
+
+    Returns:
+        func: `parse(value)` returning a datetime or raising ValueError
+
+    """
+    regex = _compile_datetime_pattern(pattern)
+    if regex is None:
+        return lambda value: datetime.strptime(value, pattern)
+    match = regex.match
+    # Missing fields are taken from the defaults appended to matched groups
+    defaults = ('1900', '1', '1', '0', '0', '0', '0')
+    count = regex.groups
+    get_index = lambda name, default: (
+        regex.groupindex[name] - 1 if name in regex.groupindex else count + default)
+    year, month, day, hour, minute, second, fraction = [
+        get_index(name, default)
+        for default, name in enumerate(['Y', 'm', 'd', 'H', 'M', 'S', 'f'])]
+    short_year = regex.groupindex.get('y')
+    is_date = not set(regex.groupindex) & set(['H', 'M', 'S', 'f'])
+
+    def parse(value):
+        found = match(value)
+        if found is None or found.end() != len(value):
+            message = 'time data %r does not match format %r' % (value, pattern)
+            raise ValueError(message)
+        groups = found.groups() + defaults
+        if short_year is None:
+            value_year = int(groups[year])
+        else:
+            value_year = int(groups[short_year - 1])
+            value_year += 2000 if value_year <= 68 else 1900
+        if is_date:
+            return datetime(value_year, int(groups[month]), int(groups[day]))
+        return datetime(
+            value_year,
+            int(groups[month]),
+            int(groups[day]),
+            int(groups[hour]),
+            int(groups[minute]),
+            int(groups[second]),
+            int(groups[fraction].ljust(6, '0')))
+
+    # Values of the exact ISO shape are parsed in C; other values
+    # (and the ones fromisoformat rejects) are parsed as above
+    iso = _ISO_DATETIME_PATTERNS.get(pattern)
+    if iso is not None and hasattr(datetime, 'fromisoformat'):
+        match_iso = re.compile(iso[0]).match
+        prefix, length = iso[1], iso[2]
+        fromisoformat = datetime.fromisoformat
+
+        def parse_iso(value):
+            if match_iso(value):
+                try:
+                    return fromisoformat(prefix + value[:length])
+                except ValueError:
+                    pass
+            return parse(value)
+
+        return parse_iso
+
+    return parse
+
+
+def _compile_datetime_pattern(pattern):
+    # The same transformations as `_strptime.TimeRE.pattern`
+    pattern = re.sub(r'([\\.^$*+?\(\){}\[\]|])', r'\\\1', pattern)
+    pattern = re.sub(r'\s+', r'\\s+', pattern)
+    regex = ''
+    directives = set()
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char != '%':
+            regex += char
+            index += 1
+            continue
+        directive = pattern[index + 1:index + 2]
+        if directive == '%':
+            regex += '%'
+        elif directive in _DATETIME_DIRECTIVES and directive not in directives:
+            regex += _DATETIME_DIRECTIVES[directive]
+            directives.add(directive)
+        else:
+            return None
+        index += 2
+    if 'Y' in directives and 'y' in directives:
+        return None
+    return re.compile(regex, re.IGNORECASE)
+
+
+_DATETIME_DIRECTIVES = {
+    'd': r'(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])',
+    'f': r'(?P<f>[0-9]{1,6})',
+    'H': r'(?P<H>2[0-3]|[0-1]\d|\d)',
+    'm': r'(?P<m>1[0-2]|0[1-9]|[1-9])',
+    'M': r'(?P<M>[0-5]\d|\d)',
+    'S': r'(?P<S>6[0-1]|[0-5]\d|\d)',
+    'y': r'(?P<y>\d\d)',
+    'Y': r'(?P<Y>\d\d\d\d)',
+}
+
+
+# Pattern: (ASCII value regex, fromisoformat prefix, value length to use)
+_ISO_DATETIME_PATTERNS = {
+    '%Y-%m-%d': (r'[0-9]{4}-[0-9]{2}-[0-9]{2}\Z', '', 10),
+    '%Y-%m-%dT%H:%M:%S': (r'[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}\Z', '', 19),
+    '%Y-%m-%d %H:%M:%S': (r'[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2}\Z', '', 19),
+    '%Y-%m-%dT%H:%M:%SZ': (r'[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}Z\Z', '', 19),
+    '%H:%M:%S': (r'[0-9]{2}:[0-9]{2}:[0-9]{2}\Z', '1900-01-01T', 8),
+}
+
+
+class ValueSet(object):
+    """Values with constant time membership checks.
+
+    Hashable values are looked up in a frozenset; unhashable ones
+    (e.g. dicts of object fields) are compared one by one.
+
+    Args:
+        values(list): values
+
+    """
+
+    # Public
+
+    def __init__(self, values):
+        self.__values = list(values)
+        hashable = []
+        self.__unhashable = []
+        for value in self.__values:
+            try:
+                hash(value)
+                hashable.append(value)
+            except TypeError:
+                self.__unhashable.append(value)
+        self.__set = frozenset(hashable)
+
+    def __contains__(self, value):
+        try:
+            if value in self.__set:
+                return True
+        except TypeError:
+            pass
+        return bool(self.__unhashable) and value in self.__unhashable
+
+    def __iter__(self):
+        return iter(self.__values)
+
+    def __len__(self):
+        return len(self.__values)
+
+    def __repr__(self):
+        return repr(self.__values)
+
+
 class PluginImporter(object):
     """Plugin importer.
 
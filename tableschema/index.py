@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import json
+import pickle
+import sqlite3
+from decimal import Decimal
+from .storage import Storage
+from . import exceptions
+from . import unique
+
+
+# Module API
+
+class ForeignKeyIndex(object):
+    """Foreign key index of a reference table
+
+    The index is built by reading the reference table once. Keys and
+    referenced rows (the first one for every key) are stored in a sqlite
+    database: a temporary file or the file given as `path`. Lookups are
+    made against the database so neither keys nor rows are kept in memory.
+
+    It can be passed to `table.iter` to check/resolve foreign keys
+    in a form of `foreign_keys_values={resource1: index1, ...}`.
+
+    ```python
+    index = ForeignKeyIndex(Table('people.csv', schema=schema), ['id'])
+    index.save('people.db')
+    index = ForeignKeyIndex.load('people.db')
+    table.read(relations=True, foreign_keys_values={'people': index})
+    ```
+
+    > Rows are stored pickled so load only index files you trust
+
+    # Arguments
+        source (Table/Storage/dict[]): reference table, storage or keyed rows
+        fields (str[]): reference field names
+        bucket (str): bucket name if source is a storage
+        path (str): sqlite file to write the index to (temporary if not set)
+
+    # Raises
+        TableSchemaException: raises any error that occurs during the process
+
+    """
+
+    # Public
+
+    def __init__(self, source, fields, bucket=None, path=None):
+        self.__fields = list(fields)
+        self.__connection = _connect(path or '')
+        _write_meta(self.__connection, self.__fields)
+        self.__build(source, bucket)
+
+    @classmethod
+    def load(cls, path):
+        """Load an index saved by `index.save`
+
+        Lookups are made against the sqlite file (memory-mapped if possible)
+        so the index is not read into memory.
+
+        # Arguments
+            path (str): sqlite file
+
+        # Returns
+            ForeignKeyIndex: index
+
+        """
+        connection = _connect(path)
+        row = connection.execute(
+            'SELECT value FROM meta WHERE name = ?', ('fields',)).fetchone()
+        if row is None:
+            connection.close()
+            message = 'File "%s" is not a foreign key index' % path
+            raise exceptions.TableSchemaException(message)
+        index = cls.__new__(cls)
+        index.__fields = json.loads(row[0])
+        index.__connection = connection
+        return index
+
+    @property
+    def fields(self):
+        """Reference field names
+
+        # Returns
+            str[]: field names
+
+        """
+        return self.__fields
+
+    def get(self, key, default=None):
+        """Get a referenced row for a key
+
+        # Arguments
+            key (tuple): reference field values
+            default (any): value to return if the key is not indexed
+
+        # Returns
+            dict/any: keyed row or default
+
+        """
+        row = self.__connection.execute(
+            'SELECT row FROM keys WHERE key = ?', (_encode_key(key),)).fetchone()
+        if row is None:
+            return default
+        return pickle.loads(row[0])
+
+    def save(self, path):
+        """Save the index to a sqlite file
+
+        # Arguments
+            path (str): sqlite file
+
+        """
+        connection = sqlite3.connect(path)
+        self.__connection.backup(connection)
+        connection.close()
+
+    def close(self):
+        """Close the index
+
+        A temporary index file is removed.
+
+        """
+        self.__connection.close()
+
+    def __contains__(self, key):
+        row = self.__connection.execute(
+            'SELECT 1 FROM keys WHERE key = ?', (_encode_key(key),)).fetchone()
+        return row is not None
+
+    def __getitem__(self, key):
+        row = self.get(key)
+        if row is None:
+            raise KeyError(key)
+        return row
+
+    def __len__(self):
+        return self.__connection.execute('SELECT COUNT(*) FROM keys').fetchone()[0]
+
+    # Private
+
+    def __build(self, source, bucket):
+        if isinstance(source, Storage):
+            from .table import Table
+            source = Table(bucket, storage=source)
+        rows = iter(source) if isinstance(source, list) else source.iter(keyed=True)
+        try:
+            with self.__connection:
+                self.__connection.execute('DELETE FROM keys')
+                self.__connection.executemany(
+                    'INSERT OR IGNORE INTO keys VALUES (?, ?)',
+                    ((_encode_key(tuple(row[name] for name in self.__fields)),
+                      pickle.dumps(dict(row), _PICKLE_PROTOCOL))
+                     for row in rows))
+        finally:
+            # Release the reference table's stream
+            if hasattr(rows, 'close'):
+                rows.close()
+
+
+# Internal
+
+_MMAP_SIZE = 2 ** 30
+_PICKLE_PROTOCOL = 2
+
+
+def _connect(path):
+    connection = sqlite3.connect(path)
+    connection.execute('PRAGMA mmap_size = %s' % _MMAP_SIZE)
+    connection.execute(
+        'CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)')
+    connection.execute(
+        'CREATE TABLE IF NOT EXISTS keys (key TEXT PRIMARY KEY, row BLOB)')
+    return connection
+
+
+def _write_meta(connection, fields):
+    connection.execute(
+        'INSERT OR REPLACE INTO meta VALUES (?, ?)',
+        ('fields', json.dumps(fields)))
+
+
+def _encode_key(key):
+    return json.dumps(list(map(_normalize_value, key)), sort_keys=True)
+
+
+def _normalize_value(value):
+    # Values equal as dict keys get the same form (see `unique.normalize_value`)
+    if value is None or isinstance(value, (dict, list, str)):
+        return value
+    normal = unique.normalize_value(value)
+    if isinstance(value, (int, float, Decimal)):
+        return {'number': str(Decimal(normal).normalize())}
+    return {type(value).__name__: str(normal)}
@@ -14,19 +14,25 @@ from .table import Table
 
 def infer(source, headers=1, limit=100, confidence=0.75,
           missing_values=config.DEFAULT_MISSING_VALUES,
-          guesser_cls=None, resolver_cls=None,
-          **options):
+          guesser_cls=None, resolver_cls=None, sample='head', workers=None,
+          infer_constraints=False, seed=None, **options):
     """Infer source schema.
 
     # Arguments
         source (any): source as path, url or inline data
         headers (int/str[]): headers rows number or headers list
+        limit (int): limit rows sample size (`None` to stream the whole source)
         confidence (float): how many casting errors are allowed (as a ratio, between 0 and 1)
         missing_values (str[]): list of missing values (by default `['']`)
         guesser_cls (class): you can implement inferring strategies by
             providing type-guessing and type-resolving classes [experimental]
         resolver_cls (class): you can implement inferring strategies by
             providing type-guessing and type-resolving classes [experimental]
+        sample (str): rows sample strategy: `head`, `reservoir` or `stride`
+            (see `table.infer`)
+        workers (int): number of processes to guess types in (see `schema.infer`)
+        infer_constraints (bool): suggest field constraints (see `schema.infer`)
+        seed (int/random.Random): seed for `reservoir` sampling (see `table.infer`)
 
     # Raises
         TableSchemaException: raises any error that occurs during the process
@@ -42,8 +48,11 @@ def infer(source, headers=1, limit=100, confidence=0.75,
         warnings.warn('Correct arguments order infer(source, headers)', UserWarning)
         source, headers = headers, source
 
-    table = Table(source, headers=headers, sample_size=limit, **options)
+    if limit is not None:
+        options.setdefault('sample_size', limit)
+    table = Table(source, headers=headers, **options)
     descriptor = table.infer(limit=limit, confidence=confidence,
         missing_values=missing_values, guesser_cls=guesser_cls,
-        resolver_cls=resolver_cls)
+        resolver_cls=resolver_cls, sample=sample, workers=workers,
+        infer_constraints=infer_constraints, seed=seed)
     return descriptor
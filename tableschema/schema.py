@@ -5,9 +5,15 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 import io
+import re
 import six
 import json
+import hashlib
 from collections import OrderedDict
+from collections import Counter
+from itertools import islice
+from functools import partial
+from multiprocessing import Pool
 from copy import deepcopy
 from six.moves import zip_longest
 from .profile import Profile
@@ -16,6 +22,7 @@ from . import exceptions
 from . import helpers
 from . import config
 from . import types
+from . import unique
 
 
 # Module API
@@ -31,6 +38,7 @@ class Schema(object):
         strict (bool): flag to specify validation behaviour:
             - if false, errors will not be raised but instead collected in `schema.errors`
             - if true, validation errors are raised immediately
+        cache_size (int): size of the fields' cast caches (see `Field`)
 
     # Raises
         TableSchemaException: raise any error that occurs during the process
@@ -39,18 +47,20 @@ class Schema(object):
 
     # Public
 
-    def __init__(self, descriptor={}, strict=False):
+    def __init__(self, descriptor={}, strict=False, cache_size=None):
 
         # Process descriptor
         descriptor = helpers.retrieve_descriptor(descriptor)
 
         # Set attributes
         self.__strict = strict
+        self.__cache_size = cache_size
         self.__current_descriptor = deepcopy(descriptor)
         self.__next_descriptor = deepcopy(descriptor)
         self.__profile = Profile('table-schema')
         self.__errors = []
         self.__fields = []
+        self.__row_cast_function = None
 
         # Build instance
         self.__build()
@@ -90,6 +100,11 @@ class Schema(object):
         # Never use this.descriptor inside this class (!!!)
         return self.__next_descriptor
 
+    @property
+    def _current_descriptor(self):
+        # Committed descriptor to recreate the schema (e.g. in other processes)
+        return self.__current_descriptor
+
     @property
     def missing_values(self):
         """Schema's missing values
@@ -100,6 +115,16 @@ class Schema(object):
         """
         return self.__current_descriptor.get('missingValues', [])
 
+    @property
+    def cache_size(self):
+        """Size of the fields' cast caches
+
+        # Returns
+            int/None: cache size
+
+        """
+        return self.__cache_size
+
     @property
     def primary_key(self):
         """Schema's primary keys
@@ -233,6 +258,10 @@ class Schema(object):
     def cast_row(self, row, fail_fast=False, row_number=None, exc_handler=None):
         """Cast row based on field types and formats.
 
+        Valid rows are cast by a function compiled for the schema's fields
+        on build; the field by field processing below only runs for rows
+        having errors so error reporting is not affected.
+
         # Arguments
             row (any[]: data row as an array of values
 
@@ -240,6 +269,14 @@ class Schema(object):
             any[]: returns cast data row
 
         """
+        # Cast row (fast path)
+        # All the values are valid so no errors handling is required
+        if self.__row_cast_function and len(row) == len(self.__fields):
+            try:
+                return self.__row_cast_function(row)
+            except exceptions.CastError:
+                pass
+
         exc_handler = helpers.default_exc_handler if exc_handler is None else \
             exc_handler
 
@@ -308,12 +345,93 @@ class Schema(object):
 
         return result
 
+    def cast_rows(self, rows, row_numbers=None, exc_handler=None, backend=None):
+        """Cast a batch of rows based on field types and formats.
+
+        It's a batch version of `schema.cast_row`: the rows are transposed
+        and cast column by column using `schema.cast_columns`. Errors are
+        reported row by row exactly as `schema.cast_row` does.
+
+        # Arguments
+            rows (any[][]): data rows as arrays of values
+            row_numbers (int[]): optional row numbers for error reporting
+            exc_handler (func): optional custom exception handler callable
+            backend (str): optional casting backend e.g. `numpy`
+
+        # Returns
+            any[][]: returns cast data rows
+
+        """
+        if row_numbers is None:
+            row_numbers = [None] * len(rows)
+
+        # Not all fields are valid
+        if not self.__fields or not all(self.__fields):
+            return [self.cast_row(row, row_number=row_number, exc_handler=exc_handler)
+                for row, row_number in zip(rows, row_numbers)]
+
+        # Cast columns
+        width = len(self.__fields)
+        columns = list(zip(*[row for row in rows if len(row) == width])) or [[]] * width
+        columns, errors = self.cast_columns(columns, backend=backend)
+        cast_rows = zip(*columns)
+
+        # Form rows
+        # Rows having errors are re-cast by `cast_row` for error reporting
+        result = []
+        position = 0
+        for row, row_number in zip(rows, row_numbers):
+            if len(row) == width:
+                cast_row = list(next(cast_rows))
+                if position in errors:
+                    cast_row = self.cast_row(
+                        row, row_number=row_number, exc_handler=exc_handler)
+                position += 1
+            else:
+                cast_row = self.cast_row(
+                    row, row_number=row_number, exc_handler=exc_handler)
+            result.append(cast_row)
+
+        return result
+
+    def cast_columns(self, columns, backend=None):
+        """Cast table columns based on field types and formats.
+
+        # Arguments
+            columns (any[][]): data columns as arrays of values
+                (one column per schema field)
+            backend (str): optional casting backend e.g. `numpy`
+
+        # Raises
+            CastError: if columns count doesn't match fields count
+
+        # Returns
+            (any[][], dict): returns cast columns and a dictionary of cast errors
+                in a form of `{row_index\\: {field_index\\: CastError}}`
+
+        """
+        if len(columns) != len(self.fields):
+            message = 'Columns count %s doesn\'t match fields count %s'
+            raise exceptions.CastError(message % (len(columns), len(self.fields)))
+        result = []
+        errors = {}
+        for field_index, (field, column) in enumerate(zip(self.fields, columns)):
+            column, column_errors = field.cast_many(column, backend=backend)
+            for row_index, exception in column_errors.items():
+                errors.setdefault(row_index, {})[field_index] = exception
+            result.append(column)
+        return result, errors
+
     def infer(self, rows, headers=1, confidence=0.75,
-              guesser_cls=None, resolver_cls=None):
+              guesser_cls=None, resolver_cls=None, workers=None,
+              infer_constraints=False):
         """Infer and set `schema.descriptor` based on data sample.
 
+        Rows are consumed one by one keeping only per-column counters
+        of matching types so `rows` can be an iterator over a whole table.
+
         # Arguments
-            rows (list[]): array of arrays representing rows.
+            rows (list[]): array of arrays (or iterator) representing rows.
             headers (int/str[]): data sample headers (one of):
               - row number containing headers (`rows` should contain headers rows)
               - array of headers (`rows` should NOT contain headers rows)
@@ -322,6 +440,20 @@ class Schema(object):
                  providing type-guessing and type-resolving classes [experimental]
             resolver_cls (class): you can implement inferring strategies by
                  providing type-guessing and type-resolving classes [experimental]
+            workers (int):
+                if provided, types are guessed in a pool of this number of
+                processes: a sample list is split by columns, other rows
+                are sent in blocks and their type counters are merged
+            infer_constraints (bool):
+                if true, column statistics (null count, min/max, max length,
+                distinct count and a small set of values) are collected
+                in the same pass and `constraints` are suggested for fields
+                based on the values valid for the inferred type:
+                `required` (no missing values), `unique` (no duplicate values;
+                not suggested for columns with over 10000 distinct values),
+                `minimum/maximum` (dates, times, integers and numbers),
+                `maxLength` (strings) and `enum` (strings and integers with
+                a few repeated values)
 
         # Returns
             dict: Table Schema descriptor
@@ -329,11 +461,15 @@ class Schema(object):
         """
 
         # Get headers
+        rows_count = len(rows) if isinstance(rows, (list, tuple)) else None
+        rows = iter(rows)
         if isinstance(headers, int):
             headers_row = headers
             while True:
                 headers_row -= 1
-                headers = rows.pop(0)
+                headers = next(rows)
+                if rows_count is not None:
+                    rows_count -= 1
                 if not headers_row:
                     break
         elif isinstance(headers, list):
@@ -348,33 +484,36 @@ class Schema(object):
 
         # Get descriptor
         missing_values = self.__current_descriptor.get('missingValues', config.DEFAULT_MISSING_VALUES)
-        guesser = guesser_cls() if guesser_cls else _TypeGuesser(missing_values)
         resolver = (resolver_cls or _TypeResolver)()
         descriptor = {'fields': [], 'missingValues': missing_values}
-        type_matches = {}
         for number, header in enumerate(headers, start=1):
             descriptor['fields'].append({'name': header or 'field%s' % number})
-        for index, row in enumerate(rows):
-            # Normalize rows with invalid dimensions for sanity
-            row_length = len(row)
-            headers_length = len(headers)
-            if row_length > headers_length:
-                row = row[:len(headers)]
-            if row_length < headers_length:
-                diff = headers_length - row_length
-                fill = [''] * diff
-                row = row + fill
-            # build a column-wise lookup of type matches
-            for index, value in enumerate(row):
-                rv = guesser.cast(value)
-                if type_matches.get(index):
-                    type_matches[index].extend(rv)
-                else:
-                    type_matches[index] = list(rv)
+        # if the number of rows is known a type/format which has already
+        # failed for too many values can't be chosen so it's not tried anymore
+        max_failures = None
+        if guesser_cls is None and rows_count is not None:
+            max_failures = (1 - confidence) * rows_count
+        width = len(headers)
+        profiles = {} if infer_constraints else None
+        if workers:
+            type_counters = _count_types_parallel(
+                rows, width, guesser_cls, missing_values, max_failures, workers,
+                profiles=profiles)
+        else:
+            guesser = guesser_cls() if guesser_cls else _TypeGuesser(missing_values)
+            type_counters = _count_types(
+                rows, width, guesser, max_failures, profiles=profiles)
         # choose a type/format for each column based on the matches
-        for index, results in type_matches.items():
+        for index, counter in type_counters.items():
+            results = counter
+            if not isinstance(resolver, _TypeResolver):
+                results = list(counter.elements())
             rv = resolver.get(results, confidence)
             descriptor['fields'][index].update(**rv)
+            if profiles is not None:
+                constraints = profiles[index].get_constraints(rv['type'], rv['format'])
+                if constraints:
+                    descriptor['fields'][index]['constraints'] = constraints
 
         # Save descriptor
         self.__current_descriptor = descriptor
@@ -472,7 +611,8 @@ class Schema(object):
         for field in self.__current_descriptor.get('fields', []):
             missing_values = self.__current_descriptor['missingValues']
             try:
-                field = Field(field, missing_values=missing_values, schema=self)
+                field = Field(field, missing_values=missing_values,
+                              cache_size=self.__cache_size, schema=self)
             except exceptions.TableSchemaException as e:
                 if self.__strict:
                     raise e
@@ -480,12 +620,182 @@ class Schema(object):
                     field = False
             self.__fields.append(field)
 
+        # Compile row cast
+        self.__row_cast_function = self.__get_row_cast_function()
+
+    def __get_row_cast_function(self):
+
+        # Not all fields are valid
+        if not all(self.__fields):
+            return None
+
+        # Compile function
+        casts = [field.compiled_cast_function for field in self.__fields]
+
+        def row_cast_function(row):
+            return [cast(value) for cast, value in zip(casts, row)]
+
+        return row_cast_function
+
     # Deprecated
 
     headers = field_names
     has_field = get_field
 
 
+class InferenceState(object):
+    """Mergeable state of a schema inference.
+
+    It keeps only per-column counters of matching types so it can be updated
+    with any number of rows, merged with states built from other parts
+    of the data (e.g. partitions inferred on different machines)
+    and serialized to JSON.
+
+    ```python
+    state = InferenceState(['id', 'name'])
+    state.update([['1', 'Paul'], ['2', 'Jimmy']])
+    other = InferenceState.from_dict(json.loads(data))
+    descriptor = state.merge(other).to_descriptor(confidence=0.75)
+    ```
+
+    # Arguments
+        headers (str[]): field names
+        missing_values (str[]): list of missing values (by default `['']`)
+
+    """
+
+    # Public
+
+    def __init__(self, headers, missing_values=config.DEFAULT_MISSING_VALUES):
+        self.__headers = list(headers)
+        self.__missing_values = list(missing_values)
+        self.__guesser = _TypeGuesser(self.__missing_values)
+        self.__type_counters = {}
+        self.__row_count = 0
+
+    @property
+    def headers(self):
+        """Field names
+
+        # Returns
+            str[]: field names
+
+        """
+        return self.__headers
+
+    @property
+    def row_count(self):
+        """Number of rows the state has been updated with
+
+        # Returns
+            int: number of rows
+
+        """
+        return self.__row_count
+
+    def update(self, rows):
+        """Update the state with data rows
+
+        # Arguments
+            rows (list[]): array of arrays (or iterator) representing data rows
+
+        # Returns
+            InferenceState: the state
+
+        """
+
+        # Count rows while they are consumed
+        def count_rows(rows):
+            for row in rows:
+                self.__row_count += 1
+                yield row
+
+        rows = count_rows(rows)
+        type_counters = _count_types(rows, len(self.__headers), self.__guesser)
+        self.__update_counters(type_counters)
+        return self
+
+    def merge(self, other):
+        """Merge other state into the state
+
+        # Arguments
+            other (InferenceState): state with the same headers and missing values
+
+        # Raises
+            TableSchemaException: if headers or missing values don't match
+
+        # Returns
+            InferenceState: the state
+
+        """
+        if (other.headers != self.__headers or
+                other.__missing_values != self.__missing_values):
+            message = 'Inference states have different headers or missing values'
+            raise exceptions.TableSchemaException(message)
+        self.__update_counters(other.__type_counters)
+        self.__row_count += other.row_count
+        return self
+
+    def to_descriptor(self, confidence=0.75):
+        """Get a Table Schema descriptor for the state
+
+        # Arguments
+            confidence (float): how many casting errors are allowed (as a ratio, between 0 and 1)
+
+        # Returns
+            dict: Table Schema descriptor
+
+        """
+        resolver = _TypeResolver()
+        descriptor = {'fields': [], 'missingValues': self.__missing_values}
+        for number, header in enumerate(self.__headers, start=1):
+            descriptor['fields'].append({'name': header or 'field%s' % number})
+        for index, counter in sorted(self.__type_counters.items()):
+            descriptor['fields'][index].update(**resolver.get(counter, confidence))
+        return descriptor
+
+    def to_dict(self):
+        """Get a JSON serializable representation of the state
+
+        # Returns
+            dict: state (see `InferenceState.from_dict`)
+
+        """
+        return {
+            'headers': self.__headers,
+            'missingValues': self.__missing_values,
+            'rowCount': self.__row_count,
+            'types': {
+                str(index): [list(result) + [count] for result, count in counter.items()]
+                for index, counter in self.__type_counters.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a state from its `to_dict` representation
+
+        # Arguments
+            data (dict): state representation
+
+        # Returns
+            InferenceState: state
+
+        """
+        state = cls(data['headers'], missing_values=data['missingValues'])
+        state.__row_count = data['rowCount']
+        for index, results in data['types'].items():
+            counter = state.__type_counters[int(index)] = Counter()
+            for name, format, priority, count in results:
+                counter[(name, format, priority)] = count
+        return state
+
+    # Private
+
+    def __update_counters(self, type_counters):
+        for index, counter in type_counters.items():
+            self.__type_counters.setdefault(index, Counter()).update(counter)
+
+
 class FailedCast(object):
     """Wrap an original data field value that failed to be properly casted.
 
@@ -539,6 +849,10 @@ class FailedCast(object):
     def __hash__(self):
         return object.__hash__(self)
 
+    def __reduce__(self):
+        # Attribute access is delegated so pickle needs the explicit way
+        return (FailedCast, (self._value,))
+
 
 # Internal
 _INFER_DATE_FORMATS = [
@@ -574,6 +888,10 @@ _INFER_TYPE_ORDER = [
 
 class _TypeGuesser(object):
     """Guess the type for a value returning a tuple of ('type', 'format')
+
+    Only the given candidates (all by default) are tried. For string values
+    cheap character checks skip candidates the value can't match
+    (e.g. no digits for integer or no "{" for object).
     """
 
     # Public
@@ -581,38 +899,189 @@ class _TypeGuesser(object):
     def __init__(self, missing_values):
         self.missing_values = missing_values
 
-    def cast(self, value):
-        for priority, type_rec in enumerate(_INFER_TYPE_ORDER):
-            if isinstance(type_rec, tuple):
-                name, formats = type_rec
+    def cast(self, value, candidates=None, results=None):
+        if value in self.missing_values:
+            return
+        is_string = isinstance(value, six.string_types)
+        for candidate in candidates or _INFER_CANDIDATES:
+            prefilter = _INFER_PREFILTERS[candidate]
+            if is_string and prefilter is not None and not prefilter(value):
+                continue
+            result = _INFER_CASTS[candidate](value)
+            if result != config.ERROR:
+                if results is not None:
+                    results[candidate] = result
+                yield candidate
+
+
+def _count_types(rows, width, guesser, max_failures=None, profiles=None):
+    type_counters = {}
+    type_candidates = {}
+    is_builtin_guesser = isinstance(guesser, _TypeGuesser)
+    for row in rows:
+        # Normalize rows with invalid dimensions for sanity
+        row_length = len(row)
+        if row_length > width:
+            row = row[:width]
+        if row_length < width:
+            diff = width - row_length
+            fill = [''] * diff
+            row = row + fill
+        # count type matches column-wise
+        for index, value in enumerate(row):
+            counter = type_counters.get(index)
+            if counter is None:
+                counter = type_counters[index] = Counter()
+            candidates = None
+            if max_failures is not None:
+                candidates = type_candidates.get(index, _INFER_CANDIDATES)
+            if profiles is not None:
+                # the cast values are kept for the column statistics
+                profile = profiles.get(index)
+                if profile is None:
+                    profile = profiles[index] = _ColumnProfile()
+                results = {}
+                if is_builtin_guesser:
+                    matches = list(guesser.cast(value, candidates, results))
+                else:
+                    matches = list(guesser.cast(value))
+                profile.update(value, matches, results)
+            elif candidates is None:
+                counter.update(guesser.cast(value))
+                continue
             else:
-                name, formats = type_rec, ['default']
-            cast = getattr(types, 'cast_%s' % name)
-            if value not in self.missing_values:
-                for format in formats:
-                    result = cast(format, value)
-                    if result != config.ERROR:
-                        yield (name, format, priority)
+                matches = list(guesser.cast(value, candidates))
+            counter.update(matches)
+            if candidates is not None and matches and len(matches) < len(candidates):
+                count = counter[_INFER_ANY_CANDIDATE]
+                type_candidates[index] = [
+                    candidate for candidate in candidates
+                    if count - counter[candidate] <= max_failures]
+    return type_counters
+
+
+def _count_types_parallel(rows, width, guesser_cls, missing_values,
+                          max_failures, workers, profiles=None):
+    tasks = []
+    offsets = []
+    if max_failures is not None:
+        # Split by columns to keep candidates elimination
+        columns = list(zip(*[list(row[:width]) + [''] * (width - len(row)) for row in rows]))
+        size = -(-len(columns) // workers) or 1
+        for offset in range(0, len(columns), size):
+            block = columns[offset:offset + size]
+            tasks.append((list(zip(*block)), len(block), guesser_cls,
+                          missing_values, max_failures, profiles is not None))
+            offsets.append(offset)
+    else:
+        # Split by rows (e.g. for a stream)
+        def iter_tasks():
+            while True:
+                block = list(islice(rows, config.DEFAULT_BATCH_SIZE))
+                if not block:
+                    break
+                yield (block, width, guesser_cls, missing_values, None,
+                       profiles is not None)
+        tasks = iter_tasks()
+    type_counters = {}
+    pool = Pool(workers)
+    try:
+        results = pool.imap(_count_types_task, tasks)
+        for number, (counters, task_profiles) in enumerate(results):
+            offset = offsets[number] if offsets else 0
+            for index, counter in counters.items():
+                type_counters.setdefault(offset + index, Counter()).update(counter)
+            for index, profile in (task_profiles or {}).items():
+                if offset + index in profiles:
+                    profile = profiles[offset + index].merge(profile)
+                profiles[offset + index] = profile
+    finally:
+        pool.terminate()
+    return type_counters
+
+
+def _count_types_task(task):
+    rows, width, guesser_cls, missing_values, max_failures, profile = task
+    guesser = guesser_cls() if guesser_cls else _TypeGuesser(missing_values)
+    profiles = {} if profile else None
+    type_counters = _count_types(rows, width, guesser, max_failures, profiles=profiles)
+    return type_counters, profiles
+
+
+def _create_infer_prefilter(name, format):
+    if name in ['geojson', 'object']:
+        return lambda value: '{' in value
+    if name == 'array':
+        return lambda value: '[' in value
+    if name == 'geopoint':
+        return lambda value: ',' in value
+    if name == 'duration':
+        return lambda value: 'P' in value
+    if name == 'integer':
+        return _INFER_DIGIT_PATTERN.search
+    if name == 'number':
+        return _INFER_NUMBER_PATTERN.search
+    if name in _INFER_DEFAULT_PATTERNS:
+        pattern = _INFER_DEFAULT_PATTERNS[name] if format == 'default' else format
+        # strptime matches letters ignoring case and spaces as any whitespace
+        chars = set(char for char in re.sub(r'%.', '', pattern)
+                    if not char.isalpha() and not char.isspace())
+        if chars:
+            return lambda value: all(char in value for char in chars)
+    return None
+
+
+_INFER_DIGIT_PATTERN = re.compile(r'\d')
+_INFER_NUMBER_PATTERN = re.compile(r'[\dnN]')
+_INFER_DEFAULT_PATTERNS = {
+    'datetime': '%Y-%m-%dT%H:%M:%SZ',
+    'time': '%H:%M:%S',
+    'date': '%Y-%m-%d',
+}
+
+
+def _create_infer_candidates():
+    candidates = []
+    casts = {}
+    prefilters = {}
+    for priority, type_rec in enumerate(_INFER_TYPE_ORDER):
+        if isinstance(type_rec, tuple):
+            name, formats = type_rec
+        else:
+            name, formats = type_rec, ['default']
+        for format in formats:
+            candidate = (name, format, priority)
+            candidates.append(candidate)
+            compile = getattr(types, 'compile_%s' % name, None)
+            if compile is not None:
+                casts[candidate] = compile(format)
+            else:
+                casts[candidate] = partial(getattr(types, 'cast_%s' % name), format)
+            prefilters[candidate] = _create_infer_prefilter(name, format)
+    return candidates, casts, prefilters
+
+
+_INFER_CANDIDATES, _INFER_CASTS, _INFER_PREFILTERS = _create_infer_candidates()
+_INFER_ANY_CANDIDATE = _INFER_CANDIDATES[-1]
 
 
 class _TypeResolver(object):
     """Get the best matching type/format from a list of possible ones.
+
+    Results can be given as a list or as a mapping of result counts.
     """
 
     # Public
 
     def get(self, results, confidence):
-        variants = set(results)
+        counts = results
+        if not isinstance(counts, dict):
+            counts = Counter(results)
         # only one candidate... that's easy.
-        if len(variants) == 1:
-            rv = {'type': results[0][0], 'format': results[0][1]}
+        if len(counts) == 1:
+            result = next(iter(counts))
+            rv = {'type': result[0], 'format': result[1]}
         else:
-            counts = {}
-            for result in results:
-                if counts.get(result):
-                    counts[result] += 1
-                else:
-                    counts[result] = 1
             # tuple representation of `counts` dict sorted by values
             sorted_counts = sorted(counts.items(), key=lambda item: item[1], reverse=True)
             if not sorted_counts:
@@ -626,3 +1095,187 @@ class _TypeResolver(object):
                                    key=lambda item: item[0][2])
             rv = {'type': sorted_counts[0][0][0], 'format': sorted_counts[0][0][1]}
         return rv
+
+
+class _ColumnProfile(object):
+    """Statistics of a column collected along with the type matches.
+
+    Statistics are kept for every matched type/format so the ones of
+    the resolved type can be used: count and distinct count of cast values
+    (while there are not too many of them) and minimum/maximum of
+    orderable types.
+    Texts of a few first values are kept with their cast values for enums.
+    Profiles can be merged.
+    """
+
+    # Public
+
+    def __init__(self):
+        self.missing = 0
+        self.max_length = 0
+        self.values = OrderedDict()
+        self.distinct = {}
+        self.bounds = {}
+
+    def update(self, value, matches, results):
+        if not matches:
+            self.missing += 1
+            return
+        text = value if isinstance(value, six.string_types) else six.text_type(value)
+        self.max_length = max(self.max_length, len(text))
+        value_results = None
+        if self.values is not None and text not in self.values:
+            value_results = {}
+        value_digest = None
+        for candidate in matches:
+            result = results.get(candidate, config.ERROR)
+            if result == config.ERROR:
+                cast = _INFER_CASTS.get(candidate)
+                result = cast(value) if cast is not None else value
+            if value_results is not None:
+                value_results[candidate] = result
+            if result is value:
+                # e.g. string and any
+                if value_digest is None:
+                    value_digest = _get_value_digest(value)
+                digest = value_digest
+            else:
+                digest = _get_value_digest(result)
+            distinct = self.distinct.get(candidate)
+            if distinct is None:
+                distinct = self.distinct[candidate] = _DistinctCounter()
+            distinct.add(digest)
+            if candidate[0] in _INFER_ORDERED_TYPES:
+                self.__update_bounds(candidate, result, value)
+        if value_results is not None:
+            self.values[text] = value_results
+            if len(self.values) > _INFER_ENUM_SIZE:
+                self.values = None
+
+    def merge(self, other):
+        self.missing += other.missing
+        self.max_length = max(self.max_length, other.max_length)
+        if self.values is not None and other.values is not None:
+            for text, value_results in other.values.items():
+                self.values.setdefault(text, value_results)
+            if len(self.values) > _INFER_ENUM_SIZE:
+                self.values = None
+        else:
+            self.values = None
+        for candidate, distinct in other.distinct.items():
+            if candidate in self.distinct:
+                distinct = self.distinct[candidate].merge(distinct)
+            self.distinct[candidate] = distinct
+        for candidate, bounds in other.bounds.items():
+            if bounds is None:
+                self.bounds[candidate] = None
+                continue
+            self.__update_bounds(candidate, bounds[0], bounds[1])
+            self.__update_bounds(candidate, bounds[2], bounds[3])
+        return self
+
+    def get_constraints(self, type, format):
+        constraints = {}
+        candidate = None
+        for match in self.distinct:
+            if match[0] == type and match[1] == format:
+                candidate = match
+        count = self.distinct[candidate].count if candidate else 0
+        if not count:
+            return constraints
+        if not self.missing:
+            constraints['required'] = True
+        if count > 1 and self.distinct[candidate].is_unique():
+            constraints['unique'] = True
+        if type in ['string', 'integer'] and self.values is not None:
+            # values are compared by their cast values
+            enum = OrderedDict()
+            for text, value_results in self.values.items():
+                if candidate in value_results:
+                    enum.setdefault(_get_value_digest(value_results[candidate]), text)
+            if count >= len(enum) * _INFER_ENUM_REPEATS:
+                constraints['enum'] = list(enum.values())
+        if type == 'string':
+            constraints['maxLength'] = self.max_length
+        bounds = self.bounds.get(candidate)
+        if bounds is not None:
+            constraints['minimum'] = _get_constraint_value(type, bounds[0], bounds[1])
+            constraints['maximum'] = _get_constraint_value(type, bounds[2], bounds[3])
+        return constraints
+
+    # Private
+
+    def __update_bounds(self, candidate, result, value):
+        if candidate not in self.bounds:
+            self.bounds[candidate] = [result, value, result, value]
+            return
+        bounds = self.bounds[candidate]
+        if bounds is None:
+            return
+        try:
+            if result < bounds[0]:
+                bounds[0], bounds[1] = result, value
+            if result > bounds[2]:
+                bounds[2], bounds[3] = result, value
+        except TypeError:
+            # e.g. naive and aware datetimes can't be compared
+            self.bounds[candidate] = None
+
+
+class _DistinctCounter(object):
+    """Count and distinct count of 64-bit digests.
+
+    Digests are kept up to `_INFER_EXACT_DISTINCT` distinct ones. After that
+    only values are counted and the column is not suggested to be unique.
+    """
+
+    # Public
+
+    def __init__(self):
+        self.count = 0
+        self.digests = set()
+
+    def add(self, digest):
+        self.count += 1
+        if self.digests is not None:
+            self.digests.add(digest)
+            if len(self.digests) > _INFER_EXACT_DISTINCT:
+                self.digests = None
+
+    def merge(self, other):
+        self.count += other.count
+        if self.digests is not None and other.digests is not None:
+            self.digests.update(other.digests)
+            if len(self.digests) > _INFER_EXACT_DISTINCT:
+                self.digests = None
+        else:
+            self.digests = None
+        return self
+
+    def is_unique(self):
+        return self.digests is not None and len(self.digests) >= self.count
+
+
+def _get_value_digest(result):
+    if isinstance(result, six.text_type):
+        digest = hashlib.blake2b(result.encode('utf-8'), digest_size=8).digest()
+    else:
+        # Equal cast values get the same digest (see `unique.create_key_digest`)
+        digest = unique.create_key_digest((result,))[:8]
+    return int.from_bytes(digest, 'big')
+
+
+def _get_constraint_value(type, result, value):
+    if type == 'integer':
+        return result
+    if isinstance(value, six.string_types):
+        return value
+    if hasattr(result, 'isoformat'):
+        return result.isoformat()
+    return str(result)
+
+
+_INFER_ORDERED_TYPES = ['datetime', 'time', 'date', 'integer', 'number']
+_INFER_ENUM_SIZE = 10
+_INFER_ENUM_REPEATS = 2
+_INFER_EXACT_DISTINCT = 10000
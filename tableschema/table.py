@@ -4,15 +4,23 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import random
 from copy import copy
 from tabulator import Stream
 from functools import partial
+from itertools import islice
+from collections import deque
+from multiprocessing import Pool
+from six.moves import zip_longest
 from collections import OrderedDict
+from six.moves.collections_abc import Mapping
 from .storage import Storage
-from .schema import Schema
+from .schema import Schema, FailedCast
+from .index import ForeignKeyIndex
 from . import exceptions
 from . import helpers
 from . import config
+from . import unique
 from collections import defaultdict
 
 
@@ -30,6 +38,11 @@ class Table(object):
       strict (bool): strictness option to pass to `Schema` constructor
       post_cast (function[]): list of post cast processors
       storage (None): storage name like `sql` or `bigquery`
+      batch_size (int): if provided, rows will be cast in batches of this size
+        column by column (see `schema.cast_rows`) instead of row by row
+      backend (str): casting backend for batches e.g. `numpy` to cast
+        number, boolean, date and datetime columns using NumPy
+        (`pip install tableschema[numpy]`); implies batch casting
       options (dict): `tabulator` or storage's options
 
     # Raises
@@ -40,7 +53,8 @@ class Table(object):
     # Public
 
     def __init__(self, source, schema=None, strict=False,
-                 post_cast=[], storage=None, **options):
+                 post_cast=[], storage=None, batch_size=None, backend=None,
+                 **options):
 
         # Set attributes
         self.__source = source
@@ -49,6 +63,12 @@ class Table(object):
         self.__headers = None
         self.__storage = None
         self.__post_cast = copy(post_cast)
+        self.__batch_size = batch_size
+        self.__backend = backend
+
+        # Batch size
+        if backend and not batch_size:
+            self.__batch_size = config.DEFAULT_BATCH_SIZE
 
         # Schema
         if isinstance(schema, Schema):
@@ -121,7 +141,9 @@ class Table(object):
 
     def iter(self, keyed=False, extended=False, cast=True,
              integrity=False, relations=False,
-             foreign_keys_values=False, exc_handler=None):
+             foreign_keys_values=False, exc_handler=None, workers=None,
+             unique_check='memory', relations_strategy='index',
+             dictionary_encode=False):
         """Iterates through the table data and emits rows cast based on table schema.
 
         # Arguments
@@ -148,19 +170,62 @@ class Table(object):
                 of `{resource1\\: [{field1\\: value1, field2\\: value2}, ...], ...}`.
                 If provided, foreign key fields will checked and resolved
                 to one of their references (/!\\ one-to-many fk are not completely resolved).
+                Instead of a list of rows a resource can be given as a `Table`
+                or a `Storage` (the bucket named as the resource is used).
+                Such resources are streamed once to index the keys and
+                the referenced rows in a temporary sqlite file.
 
             foreign_keys_values (dict):
                 three-level dictionary of foreign key references optimized
                 to speed up validation process in a form of
                 `{resource1\\: {(fk_field1, fk_field2)\\: {(value1, value2)\\: {one_keyedrow}, ... }}}`.
                 If not provided but relations is true, it will be created
-                before the validation process by *index_foreign_keys_values* method
+                before the validation process by *index_foreign_keys_values* method.
+                Prebuilt indexes can be provided instead
+                in a form of `{resource1\\: ForeignKeyIndex, ...}`
+                (see `tableschema.ForeignKeyIndex`)
 
             exc_handler (func):
                 optional custom exception handler callable.
                 Can be used to defer raising errors (i.e. "fail late"), e.g.
                 for data validation purposes. Must support the signature below
 
+            workers (int):
+                if provided, rows will be cast in a pool of this number of
+                processes. The rows are sent to the pool in batches (of
+                `batch_size` or 1000 rows) and reassembled in order so
+                unique and foreign keys are checked as usual.
+
+            unique_check (str/class):
+                unique/primary key checker: `memory` (default) keeps all
+                the keys in memory, `disk` keeps a bounded number of key
+                digests in memory spilling the rest to temporary files,
+                `bloom` uses a fixed size Bloom filter and verifies
+                suspected duplicates by a second pass over the table
+                (it can't be used for file-like or iterator sources).
+                A custom checker class (see `tableschema.unique`) can be
+                provided as well. Duplicates found by the `disk` and `bloom`
+                checkers on the table end are reported after the last row
+                without row data (key values are passed as error data).
+                Keys with values failed to be cast are not checked.
+
+            relations_strategy (str):
+                foreign keys resolution strategy: `index` (default) indexes
+                the references before iterating the table, `merge` walks
+                the table and every reference in lockstep using constant
+                memory. The `merge` strategy requires the table and
+                the references to be sorted by the foreign key fields;
+                otherwise `RelationError` is raised as soon as it's found
+                (a reference row out of order can be reported as unresolved).
+
+            dictionary_encode (bool):
+                if true, repeated string values of string fields and fields
+                with an `enum` constraint are interned: every distinct value
+                of a column is kept once in a per-column dictionary and
+                rows share it instead of holding their own copies.
+                A column having more than `config.DEFAULT_DICTIONARY_SIZE`
+                distinct values is not interned anymore.
+
         # Custom exception handler
 
         ```python
@@ -193,147 +258,18 @@ class Table(object):
             Iterator[list]: yields rows
 
         """
-        exc_handler = helpers.default_exc_handler if exc_handler is None else \
-            exc_handler
-
-        # Prepare unique checks
-        if cast:
-            unique_fields_cache = {}
-            if self.schema:
-                unique_fields_cache = _create_unique_fields_cache(self.schema)
-        # Prepare relation checks
-        if relations and not foreign_keys_values:
-            # we have to test relations but the index has not been precomputed
-            # prepare the index to boost validation process
-            foreign_keys_values = self.index_foreign_keys_values(relations)
-
-        # Open/iterate stream
-        with self.__stream as stream:
-            iterator = stream.iter(extended=True)
-            iterator = self.__apply_processors(
-                iterator, cast=cast, exc_handler=exc_handler)
-            for row_number, headers, row in iterator:
-
-                # Get headers
-                if not self.__headers:
-                    self.__headers = headers
-
-                # Check headers
-                if cast:
-                    if self.schema and self.headers:
-                        if self.headers != self.schema.field_names:
-                            message = (
-                                'Table headers (%r) don\'t match '
-                                'schema field names (%r) in row %s' % (
-                                    self.headers, self.schema.field_names,
-                                    row_number))
-                            keyed_row = OrderedDict(zip(headers, row))
-                            exc_handler(
-                                exceptions.CastError(message),
-                                row_number=row_number, row_data=keyed_row,
-                                error_data=keyed_row)
-                            continue
-
-                # Check unique
-                if cast:
-                    for indexes, cache in unique_fields_cache.items():
-                        keyed_values = OrderedDict(
-                            (headers[i], value)
-                            for i, value in enumerate(row) if i in indexes)
-                        values = tuple(keyed_values.values())
-                        if not all(map(lambda value: value is None, values)):
-                            if values in cache['data']:
-                                message = (
-                                    'Field(s) "%s" duplicates in row "%s" '
-                                    'for values %r' % (
-                                        cache['name'], row_number, values))
-                                exc_handler(
-                                    exceptions.UniqueKeyError(message),
-                                    row_number=row_number,
-                                    row_data=OrderedDict(zip(headers, row)),
-                                    error_data=keyed_values)
-                            cache['data'].add(values)
-
-                # Resolve relations
-                if relations:
-                    if self.schema:
-                        row_with_relations = dict(zip(headers, copy(row)))
-                        for foreign_key in self.schema.foreign_keys:
-                            refValue = _resolve_relations(row, headers, foreign_keys_values,
-                                                          foreign_key)
-                            if refValue is None:
-                                keyed_row = OrderedDict(zip(headers, row))
-                                # local values of the FK
-                                local_keyed_values = {
-                                    key: keyed_row[key]
-                                    for key in foreign_key['fields']
-                                    }
-                                local_values = tuple(local_keyed_values.values())
-                                message = (
-                                    'Foreign key "%s" violation in row "%s": '
-                                    '%s not found in %s' % (
-                                        foreign_key['fields'],
-                                        row_number,
-                                        local_values,
-                                        foreign_key['reference']['resource']))
-                                exc_handler(
-                                    exceptions.UnresolvedFKError(message),
-                                    row_number=row_number, row_data=keyed_row,
-                                    error_data=local_keyed_values)
-                                # If we reach this point we don't fail-early
-                                # i.e. no exception has been raised. As the
-                                # reference can't be resolved, use empty dict
-                                # as the "unresolved result".
-                                for field in foreign_key['fields']:
-                                    if not isinstance(
-                                            row_with_relations[field], dict):
-                                        row_with_relations[field] = {}
-                            elif type(refValue) is dict:
-                                # Substitute resolved referenced object for
-                                # original referencing field value.
-                                # For a composite foreign key, this substitutes
-                                # each part of the composite key with the
-                                # referenced object.
-                                for field in foreign_key['fields']:
-                                    if type(row_with_relations[field]) is not dict:
-                                        # no previous refValues injected on this field
-                                        row_with_relations[field] = refValue
-                                    else:
-                                        # alreayd one ref, merging
-                                        row_with_relations[field].update(refValue)
-                            else:
-                                # case when all original value of the FK are empty
-                                # refValue == row, there is nothing to do
-                                # an empty dict might be a better returned value for this case ?
-                                pass
-
-                        #  mutate row now that we are done, in the right order
-                        row = [row_with_relations[f] for f in headers]
-
-                # Form row
-                if extended:
-                    yield (row_number, headers, row)
-                elif keyed:
-                    yield dict(zip(headers, row))
-                else:
-                    yield row
-
-            # Check integrity
-            if integrity:
-                violations = []
-                size = integrity.get('size')
-                hash = integrity.get('hash')
-                if size and size != self.__stream.size:
-                    violations.append('size "%s"' % self.__stream.size)
-                if hash and hash != self.__stream.hash:
-                    violations.append('hash "%s"' % self.__stream.hash)
-                if violations:
-                    message = 'Calculated %s differ(s) from declared value(s)'
-                    raise exceptions.IntegrityError(message % ' and '.join(violations))
+        return self.__iter_rows(
+            keyed=keyed, extended=extended, cast=cast, integrity=integrity,
+            relations=relations, foreign_keys_values=foreign_keys_values,
+            exc_handler=exc_handler, batch_size=self.__batch_size,
+            workers=workers, unique_check=unique_check,
+            relations_strategy=relations_strategy,
+            dictionary_encode=dictionary_encode)
 
     def read(self, keyed=False, extended=False, cast=True, limit=None,
              integrity=False, relations=False, foreign_keys_values=False,
-             exc_handler=None):
+             exc_handler=None, workers=None, unique_check='memory',
+             relations_strategy='index', dictionary_encode=False):
         """Read the whole table and return as array of rows
 
         > It has the same API as `table.iter` except for
@@ -349,45 +285,169 @@ class Table(object):
         rows = self.iter(
             keyed=keyed, extended=extended, cast=cast, integrity=integrity,
             relations=relations, foreign_keys_values=foreign_keys_values,
-            exc_handler=exc_handler)
+            exc_handler=exc_handler, workers=workers,
+            unique_check=unique_check, relations_strategy=relations_strategy,
+            dictionary_encode=dictionary_encode)
         for count, row in enumerate(rows, start=1):
             result.append(row)
             if count == limit:
                 break
         return result
 
+    def iter_batches(self, batch_size=config.DEFAULT_BATCH_SIZE, cast=True,
+                     integrity=False, relations=False,
+                     foreign_keys_values=False, exc_handler=None,
+                     workers=None, unique_check='memory',
+                     relations_strategy='index', dictionary_encode=False):
+        """Iterates through the table data and emits column-oriented batches.
+
+        > It has the same API as `table.iter` except for
+
+        Rows are cast in batches column by column (see `schema.cast_rows`)
+        and checked for unique/primary and foreign keys as `table.iter` does.
+        Every batch is a dictionary in a form of:
+
+        ```python
+        {
+            'row_numbers': [2, 3, ...],
+            'columns': OrderedDict([('header1', [value1, ...]), ...]),
+            'errors': [False, True, ...],
+        }
+        ```
+
+        where `errors` is a mask of rows the exception handler has been
+        called for (it makes sense only with a custom `exc_handler`).
+
+        With `dictionary_encode='codes'` columns which would be interned
+        (see `table.iter`) hold integer codes instead of values (`None`
+        stays `None`) and batches get a `dictionaries` key in a form of
+        `{'header1': [value1, ...], ...}` mapping codes to values.
+        A dictionary is shared by all the batches and only grows so codes
+        stay valid. A column exceeding the dictionary size or having
+        a value which is not a string is emitted with values from that
+        batch on.
+
+        # Arguments
+            batch_size (int): maximum number of rows in a batch
+            dictionary_encode (bool/str): `True` or `codes`
+
+        # Returns
+            Iterator[dict]: yields batches
+
+        """
+        exc_handler = helpers.default_exc_handler if exc_handler is None else \
+            exc_handler
+
+        # Track rows having errors
+        error_row_numbers = set()
+
+        def batch_exc_handler(exc, row_number=None, row_data=None, error_data=None):
+            error_row_numbers.add(row_number)
+            exc_handler(exc, row_number=row_number, row_data=row_data,
+                        error_data=error_data)
+
+        # Iterate batches
+        # Prepare dictionary encoding
+        encoders = None
+        if dictionary_encode == 'codes':
+            encoders = dict((index, _ColumnEncoder())
+                            for index in _create_dictionaries(self.schema))
+            dictionary_encode = False
+
+        rows = self.__iter_rows(
+            extended=True, cast=cast, integrity=integrity, relations=relations,
+            foreign_keys_values=foreign_keys_values,
+            exc_handler=batch_exc_handler, batch_size=batch_size,
+            workers=workers, unique_check=unique_check,
+            relations_strategy=relations_strategy,
+            dictionary_encode=dictionary_encode)
+        for batch in _iter_chunks(rows, batch_size):
+            row_numbers, headers, rows = zip(*batch)
+            headers = headers[0]
+            columns = [list(column) for column in zip_longest(*rows)]
+            if not headers:
+                headers = self.__schema.field_names if self.__schema else \
+                    ['field%s' % number for number in range(1, len(columns) + 1)]
+            result = {
+                'row_numbers': list(row_numbers),
+                'columns': OrderedDict(zip(headers, columns)),
+                'errors': [number in error_row_numbers for number in row_numbers],
+            }
+            if encoders is not None:
+                result['dictionaries'] = OrderedDict()
+                for index, encoder in sorted(encoders.items()):
+                    if index >= len(columns):
+                        continue
+                    codes = encoder.encode(columns[index])
+                    if codes is None:
+                        del encoders[index]
+                        continue
+                    result['columns'][headers[index]] = codes
+                    result['dictionaries'][headers[index]] = encoder.values
+            yield result
+            error_row_numbers.clear()
+
     def infer(self, limit=100, confidence=0.75,
               missing_values=config.DEFAULT_MISSING_VALUES,
-              guesser_cls=None, resolver_cls=None):
+              guesser_cls=None, resolver_cls=None, sample='head', workers=None,
+              infer_constraints=False, seed=None):
         """Infer a schema for the table.
 
         It will infer and set Table Schema to `table.schema` based on table data.
 
         # Arguments
-            limit (int): limit rows sample size
+            limit (int):
+                limit rows sample size. If it's `None` the whole table
+                is streamed keeping only per-column type counters
             confidence (float): how many casting errors are allowed (as a ratio, between 0 and 1)
             missing_values (str[]): list of missing values (by default `['']`)
             guesser_cls (class): you can implement inferring strategies by
                  providing type-guessing and type-resolving classes [experimental]
             resolver_cls (class): you can implement inferring strategies by
                  providing type-guessing and type-resolving classes [experimental]
+            sample (str):
+                how `limit` rows are sampled: `head` (default) takes the first
+                rows, `reservoir` takes random rows and `stride` takes evenly
+                spaced rows of the whole table. The latter two read the whole
+                table without casting keeping at most `limit` (`reservoir`)
+                or `2 * limit` (`stride`) rows in memory
+            workers (int): number of processes to guess types in (see `schema.infer`)
+            infer_constraints (bool): suggest field constraints (see `schema.infer`)
+            seed (int/random.Random):
+                seed or random generator for `reservoir` sampling;
+                if provided, the sample (and the inferred schema) is reproducible
+
+        # Raises
+            TableSchemaException: raises if sample strategy is not supported
 
         # Returns
             dict: Table Schema descriptor
 
         """
+        if sample not in _SAMPLE_STRATEGIES:
+            message = 'Not supported sample strategy "%s"' % sample
+            raise exceptions.TableSchemaException(message)
         if self.__schema is None or self.__headers is None:
 
             # Infer (tabulator)
             if not self.__storage:
                 with self.__stream as stream:
                     if self.__schema is None:
+                        rows = stream.sample[:limit]
+                        if limit is None:
+                            rows = stream.iter()
+                        elif sample == 'reservoir':
+                            rows = _sample_reservoir(stream.iter(), limit, seed=seed)
+                        elif sample == 'stride':
+                            rows = _sample_stride(stream.iter(), limit)
                         self.__schema = Schema({'missingValues': missing_values})
-                        self.__schema.infer(stream.sample[:limit],
+                        self.__schema.infer(rows,
                                             headers=stream.headers,
                                             confidence=confidence,
                                             guesser_cls=guesser_cls,
-                                            resolver_cls=resolver_cls)
+                                            resolver_cls=resolver_cls,
+                                            workers=workers,
+                                            infer_constraints=infer_constraints)
                     if self.__headers is None:
                         self.__headers = stream.headers
 
@@ -463,6 +523,8 @@ class Table(object):
                 dict of foreign key references in a form of
                 `{resource1\\: [{field1\\: value1, field2\\: value2}, ...], ...}`.
                 It must contain all resources pointed in the foreign keys schema definition.
+                Resources given as `Table`, `Storage` or `ForeignKeyIndex`
+                are indexed by `ForeignKeyIndex` (stored in a sqlite file).
 
         # Returns
             dict:
@@ -488,27 +550,317 @@ class Table(object):
                 # to optimize we prepare index of existing values
                 # this index should use reference + foreign_keys as key
                 # cause many foreign keys may use the same reference
-                foreign_keys[relation][tuple(fk['reference']['fields'])] = {}
-                for row in relations[relation]:
-                    key = tuple([row[foreign_field] for foreign_field in fk['reference']['fields']])
+                fields = tuple(fk['reference']['fields'])
+                rows = relations[relation]
+                if isinstance(rows, ForeignKeyIndex):
+                    foreign_keys[relation][fields] = rows
+                    continue
+                if isinstance(rows, (Table, Storage)):
+                    foreign_keys[relation][fields] = ForeignKeyIndex(
+                        rows, fields, bucket=relation)
+                    continue
+                foreign_keys[relation][fields] = {}
+                for row in rows:
+                    key = tuple([row[foreign_field] for foreign_field in fields])
                     # here we should chose to pick the first or nth row which match
                     # previous implementation picked the first, so be it
-                    if key not in foreign_keys[relation][tuple(fk['reference']['fields'])]:
-                        foreign_keys[relation][tuple(fk['reference']['fields'])][key] = row
+                    if key not in foreign_keys[relation][fields]:
+                        foreign_keys[relation][fields][key] = row
         return foreign_keys
 
     # Private
 
-    def __apply_processors(self, iterator, cast=True, exc_handler=None):
+    def __iter_rows(self, keyed=False, extended=False, cast=True,
+                    integrity=False, relations=False,
+                    foreign_keys_values=False, exc_handler=None,
+                    batch_size=None, workers=None, unique_check='memory',
+                    relations_strategy='index', dictionary_encode=False):
+        exc_handler = helpers.default_exc_handler if exc_handler is None else \
+            exc_handler
+
+        # Prepare dictionary encoding
+        dictionaries = None
+        if dictionary_encode:
+            dictionaries = _create_dictionaries(self.schema)
+
+        # Prepare unique checks
+        if cast:
+            unique_fields_cache = {}
+            if self.schema:
+                unique_checker = unique_check
+                if not callable(unique_checker):
+                    unique_checker = unique.UNIQUE_CHECKERS.get(unique_check)
+                    if unique_checker is None:
+                        message = 'Not supported unique check "%s"' % unique_check
+                        raise exceptions.TableSchemaException(message)
+                unique_fields_cache = _create_unique_fields_cache(
+                    self.schema, unique_checker)
+                if unique_fields_cache and not _is_reopenable(self.__source) and \
+                        isinstance(unique_checker, type) and \
+                        issubclass(unique_checker, unique.BloomUniqueChecker):
+                    message = (
+                        'Unique check "bloom" requires a source '
+                        'which can be read twice (not a stream or an iterator)')
+                    raise exceptions.TableSchemaException(message)
+        # Prepare relation checks
+        if relations_strategy not in ('index', 'merge'):
+            message = 'Not supported relations strategy "%s"' % relations_strategy
+            raise exceptions.TableSchemaException(message)
+        if relations and relations_strategy == 'merge':
+            foreign_keys_values = self.__create_sorted_relations(relations)
+        if relations and not foreign_keys_values:
+            # we have to test relations but the index has not been precomputed
+            # prepare the index to boost validation process
+            foreign_keys_values = self.index_foreign_keys_values(relations)
+        if foreign_keys_values:
+            foreign_keys_values = _normalize_foreign_keys_values(foreign_keys_values)
+
+        # Open/iterate stream
+        # Inline sources are never closed so `with` wouldn't reopen them
+        self.__stream.open()
+        with self.__stream as stream:
+            iterator = stream.iter(extended=True)
+            iterator = self.__apply_processors(
+                iterator, cast=cast, exc_handler=exc_handler,
+                batch_size=batch_size, workers=workers)
+            for row_number, headers, row in iterator:
+
+                # Get headers
+                if not self.__headers:
+                    self.__headers = headers
+
+                # Check headers
+                if cast:
+                    if self.schema and self.headers:
+                        if self.headers != self.schema.field_names:
+                            message = (
+                                'Table headers (%r) don\'t match '
+                                'schema field names (%r) in row %s' % (
+                                    self.headers, self.schema.field_names,
+                                    row_number))
+                            keyed_row = OrderedDict(zip(headers, row))
+                            exc_handler(
+                                exceptions.CastError(message),
+                                row_number=row_number, row_data=keyed_row,
+                                error_data=keyed_row)
+                            continue
+
+                # Check unique
+                if cast:
+                    for indexes, cache in unique_fields_cache.items():
+                        values = _get_unique_values(row, indexes)
+                        if _is_checked_key(values):
+                            if cache['checker'].add(values, row_number):
+                                keyed_values = OrderedDict(
+                                    (headers[i], value)
+                                    for i, value in enumerate(row) if i in indexes)
+                                message = (
+                                    'Field(s) "%s" duplicates in row "%s" '
+                                    'for values %r' % (
+                                        cache['name'], row_number, values))
+                                exc_handler(
+                                    exceptions.UniqueKeyError(message),
+                                    row_number=row_number,
+                                    row_data=OrderedDict(zip(headers, row)),
+                                    error_data=keyed_values)
+
+                # Intern values
+                if dictionaries:
+                    _intern_values(row, dictionaries)
+
+                # Resolve relations
+                if relations:
+                    if self.schema:
+                        row_with_relations = dict(zip(headers, copy(row)))
+                        for foreign_key in self.schema.foreign_keys:
+                            refValue = _resolve_relations(row, headers, foreign_keys_values,
+                                                          foreign_key)
+                            if refValue is None:
+                                keyed_row = OrderedDict(zip(headers, row))
+                                # local values of the FK
+                                local_keyed_values = {
+                                    key: keyed_row[key]
+                                    for key in foreign_key['fields']
+                                    }
+                                local_values = tuple(local_keyed_values.values())
+                                message = (
+                                    'Foreign key "%s" violation in row "%s": '
+                                    '%s not found in %s' % (
+                                        foreign_key['fields'],
+                                        row_number,
+                                        local_values,
+                                        foreign_key['reference']['resource']))
+                                exc_handler(
+                                    exceptions.UnresolvedFKError(message),
+                                    row_number=row_number, row_data=keyed_row,
+                                    error_data=local_keyed_values)
+                                # If we reach this point we don't fail-early
+                                # i.e. no exception has been raised. As the
+                                # reference can't be resolved, use empty dict
+                                # as the "unresolved result".
+                                for field in foreign_key['fields']:
+                                    if not isinstance(
+                                            row_with_relations[field], dict):
+                                        row_with_relations[field] = {}
+                            elif isinstance(refValue, Mapping):
+                                # Substitute resolved referenced object for
+                                # original referencing field value.
+                                # For a composite foreign key, this substitutes
+                                # each part of the composite key with the
+                                # referenced object.
+                                for field in foreign_key['fields']:
+                                    if not isinstance(row_with_relations[field], Mapping):
+                                        # no previous refValues injected on this field
+                                        row_with_relations[field] = refValue
+                                    elif type(row_with_relations[field]) is not dict:
+                                        # other mapping, merging into a copy
+                                        row_with_relations[field] = dict(
+                                            row_with_relations[field], **refValue)
+                                    else:
+                                        # alreayd one ref, merging
+                                        row_with_relations[field].update(refValue)
+                            else:
+                                # case when all original value of the FK are empty
+                                # refValue == row, there is nothing to do
+                                # an empty dict might be a better returned value for this case ?
+                                pass
+
+                        #  mutate row now that we are done, in the right order
+                        row = [row_with_relations[f] for f in headers]
+
+                # Form row
+                if extended:
+                    yield (row_number, headers, row)
+                elif keyed:
+                    yield dict(zip(headers, row))
+                else:
+                    yield row
+
+            # Check integrity
+            if integrity:
+                violations = []
+                size = integrity.get('size')
+                hash = integrity.get('hash')
+                if size and size != self.__stream.size:
+                    violations.append('size "%s"' % self.__stream.size)
+                if hash and hash != self.__stream.hash:
+                    violations.append('hash "%s"' % self.__stream.hash)
+                if violations:
+                    message = 'Calculated %s differ(s) from declared value(s)'
+                    raise exceptions.IntegrityError(message % ' and '.join(violations))
+
+        # Check unique (deferred)
+        if cast:
+            for indexes, cache in unique_fields_cache.items():
+                iter_keys = partial(self.__iter_unique_values, indexes)
+                for row_number, values in cache['checker'].close(iter_keys):
+                    keyed_values = None
+                    if values is not None:
+                        keyed_values = OrderedDict(
+                            (self.schema.fields[index].name, value)
+                            for index, value in zip(indexes, values))
+                    message = (
+                        'Field(s) "%s" duplicates in row "%s" '
+                        'for values %r' % (cache['name'], row_number, values))
+                    exc_handler(
+                        exceptions.UniqueKeyError(message),
+                        row_number=row_number, row_data=None,
+                        error_data=keyed_values)
+
+    def __create_sorted_relations(self, relations):
+        foreign_keys = defaultdict(dict)
+        if self.schema:
+            tables = set()
+            for fk in self.schema.foreign_keys:
+                relation = fk['reference']['resource']
+                fields = tuple(fk['reference']['fields'])
+                rows = relations[relation]
+                if isinstance(rows, Storage):
+                    rows = Table(relation, storage=rows)
+                if isinstance(rows, Table):
+                    if id(rows) in tables:
+                        message = (
+                            'Merge strategy requires a separate table '
+                            'for every foreign key to resource "%s"' % relation)
+                        raise exceptions.RelationError(message)
+                    tables.add(id(rows))
+                    rows = partial(rows.iter, keyed=True)
+                foreign_keys[relation][fields] = _SortedRelation(
+                    rows, fields, relation)
+        return foreign_keys
+
+    def __iter_unique_values(self, indexes):
+
+        # Cast errors have been already reported by the first pass
+        def exc_handler(exc, row_number=None, row_data=None, error_data=None):
+            pass
+
+        # Source can be read only once
+        if not _is_reopenable(self.__source):
+            message = 'Unique check can\'t read the source twice'
+            raise exceptions.TableSchemaException(message)
+
+        self.__stream.open()
+        with self.__stream as stream:
+            for row_number, headers, row in stream.iter(extended=True):
+                row = self.__schema.cast_row(
+                    row, row_number=row_number, exc_handler=exc_handler)
+                values = _get_unique_values(row, indexes)
+                if _is_checked_key(values):
+                    yield (values, row_number)
+
+    def __apply_processors(self, iterator, cast=True, exc_handler=None,
+                           batch_size=None, workers=None):
 
         # Apply processors to iterator
         def builtin_processor(extended_rows):
+            cast_row = self.__schema.cast_row if self.__schema and cast else None
             for row_number, headers, row in extended_rows:
-                if self.__schema and cast:
-                    row = self.__schema.cast_row(
+                if cast_row:
+                    row = cast_row(
                         row, row_number=row_number, exc_handler=exc_handler)
                 yield (row_number, headers, row)
+
+        # Apply processors to iterator (batches)
+        def builtin_batch_processor(extended_rows):
+            for batch in _iter_chunks(extended_rows, batch_size):
+                row_numbers, headers, rows = zip(*batch)
+                rows, errors = _cast_batch(
+                    self.__schema, rows, row_numbers, self.__backend)
+                for extended_row in _iter_cast_batch(
+                        row_numbers, headers, rows, errors, exc_handler):
+                    yield extended_row
+
+        # Apply processors to iterator (parallel)
+        def builtin_parallel_processor(extended_rows):
+            pool = Pool(workers, initializer=_init_cast_worker,
+                        initargs=(self.__schema._current_descriptor,
+                                  self.__schema.cache_size, self.__backend))
+            try:
+                # Keep a bounded number of batches in flight
+                pending = deque()
+                batches = _iter_chunks(
+                    extended_rows, batch_size or config.DEFAULT_BATCH_SIZE)
+                while True:
+                    for batch in islice(batches, workers * 2 - len(pending)):
+                        row_numbers, headers, rows = zip(*batch)
+                        result = pool.apply_async(_cast_rows, (rows, row_numbers))
+                        pending.append((row_numbers, headers, result))
+                    if not pending:
+                        break
+                    row_numbers, headers, result = pending.popleft()
+                    rows, errors = result.get()
+                    for extended_row in _iter_cast_batch(
+                            row_numbers, headers, rows, errors, exc_handler):
+                        yield extended_row
+            finally:
+                pool.terminate()
+
         processors = [builtin_processor] + self.__post_cast
+        if self.__schema and cast and batch_size:
+            processors = [builtin_batch_processor] + self.__post_cast
+        if self.__schema and cast and workers:
+            processors = [builtin_parallel_processor] + self.__post_cast
         for processor in processors:
             iterator = processor(iterator)
 
@@ -517,7 +869,92 @@ class Table(object):
 
 # Internal
 
-def _create_unique_fields_cache(schema):
+def _iter_chunks(iterator, size):
+    iterator = iter(iterator)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            break
+        yield chunk
+
+
+def _sample_reservoir(rows, size, seed=None):
+    generator = seed if isinstance(seed, random.Random) else random.Random(seed)
+    sample = []
+    for index, row in enumerate(rows):
+        if index < size:
+            sample.append(row)
+        else:
+            position = generator.randint(0, index)
+            if position < size:
+                sample[position] = row
+    return sample
+
+
+def _sample_stride(rows, size):
+    sample = []
+    stride = 1
+    for index, row in enumerate(rows):
+        if index % stride:
+            continue
+        if len(sample) == size * 2:
+            # keep every other row and double the stride
+            del sample[1::2]
+            stride *= 2
+            if index % stride:
+                continue
+        sample.append(row)
+    if len(sample) <= size:
+        return sample
+    return [sample[index * len(sample) // size] for index in range(size)]
+
+
+_SAMPLE_STRATEGIES = ['head', 'reservoir', 'stride']
+
+
+def _cast_batch(schema, rows, row_numbers, backend):
+    errors = []
+
+    def exc_handler(exc, row_number=None, row_data=None, error_data=None):
+        errors.append((exc, row_number, row_data, error_data))
+
+    rows = schema.cast_rows(
+        rows, row_numbers=row_numbers, exc_handler=exc_handler, backend=backend)
+    return rows, errors
+
+
+def _iter_cast_batch(row_numbers, headers, rows, errors, exc_handler):
+    # Errors of a row are reported just before it's yielded so they are
+    # interleaved with unique and foreign key errors of the previous rows
+    row_errors = defaultdict(list)
+    for error in errors:
+        row_errors[error[1]].append(error)
+    for extended_row in zip(row_numbers, headers, rows):
+        for exc, row_number, row_data, error_data in row_errors.pop(extended_row[0], []):
+            exc_handler(exc, row_number=row_number,
+                        row_data=row_data, error_data=error_data)
+        yield extended_row
+
+
+def _init_cast_worker(descriptor, cache_size, backend):
+    _CAST_WORKER['schema'] = Schema(descriptor, cache_size=cache_size)
+    _CAST_WORKER['backend'] = backend
+
+
+def _cast_rows(rows, row_numbers):
+    return _cast_batch(
+        _CAST_WORKER['schema'], rows, row_numbers, _CAST_WORKER['backend'])
+
+
+_CAST_WORKER = {}
+
+
+def _is_reopenable(source):
+    # File-like objects and iterators are consumed by the first read
+    return not hasattr(source, 'read') and not hasattr(source, '__next__')
+
+
+def _create_unique_fields_cache(schema, unique_checker):
     primary_key_indexes = []
     cache = {}
 
@@ -528,19 +965,166 @@ def _create_unique_fields_cache(schema):
         if field.constraints.get('unique'):
             cache[tuple([index])] = {
                 'name': field.name,
-                'data': set(),
+                'checker': unique_checker(),
             }
 
     # Primary key
     if primary_key_indexes:
         cache[tuple(primary_key_indexes)] = {
             'name': ', '.join(schema.primary_key),
-            'data': set(),
+            'checker': unique_checker(),
         }
 
     return cache
 
 
+def _is_checked_key(values):
+    # Failed casts are reported as cast errors and being hashed
+    # by identity they are never duplicates
+    return values.count(None) != len(values) and \
+        not any(isinstance(value, FailedCast) for value in values)
+
+
+def _get_unique_values(row, indexes):
+    try:
+        return tuple([row[index] for index in indexes])
+    except IndexError:
+        return tuple(value for index, value in enumerate(row) if index in indexes)
+
+
+def _create_dictionaries(schema):
+    # Per-column dictionaries for string and enum fields
+    dictionaries = {}
+    if schema:
+        for index, field in enumerate(schema.fields):
+            if field and (field.type == 'string' or 'enum' in field.constraints):
+                dictionaries[index] = {}
+    return dictionaries
+
+
+def _intern_values(row, dictionaries):
+    # Only strings are interned: other equal values can differ
+    # e.g. `Decimal('1.0')` and `Decimal('1.00')`
+    exceeded = []
+    for index, dictionary in dictionaries.items():
+        if index >= len(row):
+            continue
+        value = row[index]
+        if type(value) is not str:
+            continue
+        row[index] = dictionary.setdefault(value, value)
+        if len(dictionary) > config.DEFAULT_DICTIONARY_SIZE:
+            exceeded.append(index)
+    for index in exceeded:
+        del dictionaries[index]
+
+
+class _ColumnEncoder(object):
+
+    # Column values to codes of a growing dictionary
+
+    def __init__(self):
+        self.values = []
+        self.__codes = {}
+
+    def encode(self, column):
+        # Returns None if the dictionary can't encode the column
+        # (the dictionary is left as it was for the previous batches)
+        codes = []
+        values = self.values
+        known_codes = self.__codes
+        size = len(values)
+        for value in column:
+            if value is None:
+                codes.append(None)
+                continue
+            if type(value) is not str:
+                # see `_intern_values`
+                codes = None
+                break
+            code = known_codes.get(value)
+            if code is None:
+                code = known_codes[value] = len(values)
+                values.append(value)
+            codes.append(code)
+        if codes is None or len(values) > config.DEFAULT_DICTIONARY_SIZE:
+            for value in values[size:]:
+                del known_codes[value]
+            del values[size:]
+            return None
+        return codes
+
+
+def _normalize_foreign_keys_values(foreign_keys_values):
+    result = {}
+    for relation, values in foreign_keys_values.items():
+        if isinstance(values, ForeignKeyIndex):
+            values = {tuple(values.fields): values}
+        result[relation] = values
+    return result
+
+
+class _SortedRelation(object):
+
+    # Foreign key references resolved by walking a reference sorted by
+    # the key fields in lockstep with a table sorted by the same values
+
+    def __init__(self, rows, fields, name):
+        self.__rows = rows
+        self.__fields = fields
+        self.__name = name
+        self.__iterator = None
+        self.__key = None
+        self.__row = None
+        self.__previous = None
+
+    def __contains__(self, key):
+        if None in key:
+            return False
+        if self.__previous is not None and _is_less(key, self.__previous):
+            message = (
+                'Table is not sorted by foreign key fields: %r goes after %r '
+                'for reference "%s"' % (key, self.__previous, self.__name))
+            raise exceptions.RelationError(message)
+        self.__previous = key
+        if self.__iterator is None:
+            rows = self.__rows() if callable(self.__rows) else self.__rows
+            self.__iterator = iter(rows)
+            self.__advance()
+        while self.__row is not None and _is_less(self.__key, key):
+            self.__advance()
+        return self.__row is not None and self.__key == key
+
+    def __getitem__(self, key):
+        return self.__row
+
+    def get(self, key, default=None):
+        return self.__row if key in self else default
+
+    def __advance(self):
+        for row in self.__iterator:
+            key = tuple(row[field] for field in self.__fields)
+            if None in key or key == self.__key:
+                continue
+            if self.__key is not None and _is_less(key, self.__key):
+                message = (
+                    'Reference "%s" is not sorted by fields %s: %r goes after %r'
+                    % (self.__name, list(self.__fields), key, self.__key))
+                raise exceptions.RelationError(message)
+            self.__key = key
+            self.__row = row
+            return
+        self.__row = None
+
+
+def _is_less(key, other):
+    try:
+        return key < other
+    except TypeError:
+        message = 'Foreign key values %r and %r can\'t be compared' % (key, other)
+        raise exceptions.RelationError(message)
+
+
 def _resolve_relations(row, headers, foreign_keys_values, foreign_key):
 
     # Prepare helpers - needed data structures
@@ -552,10 +1136,7 @@ def _resolve_relations(row, headers, foreign_keys_values, foreign_key):
         relation = foreign_key['reference']['resource']
         keys = tuple(foreign_key['reference']['fields'])
         foreign_values = foreign_keys_values[relation][keys]
-        if local_values in foreign_values:
-            return foreign_values[local_values]
-        else:
-            return None
+        return foreign_values.get(local_values)
     else:
         # empty values for all keys, return original values
         return row
@@ -10,15 +10,15 @@ from __future__ import unicode_literals
 from .any import cast_any
 from .array import cast_array
 from .boolean import cast_boolean
-from .date import cast_date
-from .datetime import cast_datetime
+from .date import cast_date, compile_date
+from .datetime import cast_datetime, compile_datetime
 from .duration import cast_duration
 from .geojson import cast_geojson
 from .geopoint import cast_geopoint
 from .integer import cast_integer
-from .number import cast_number
+from .number import cast_number, compile_number
 from .object import cast_object
 from .string import cast_string
-from .time import cast_time
+from .time import cast_time, compile_time
 from .year import cast_year
 from .yearmonth import cast_yearmonth
@@ -4,10 +4,13 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import re
 import six
 import warnings
 from datetime import datetime, date
+from functools import partial
 from dateutil.parser import parse
+from ..helpers import create_datetime_parser
 from ..config import ERROR
 
 
@@ -30,7 +33,7 @@ def cast_date(format, value, **options):
     # Parse string date
     try:
         if format == 'default':
-            value = datetime.strptime(value, _DEFAULT_PATTERN).date()
+            value = _parse_default(value).date()
         elif format == 'any':
             value = parse(value).date()
         else:
@@ -47,6 +50,41 @@ def cast_date(format, value, **options):
     return value
 
 
+def compile_date(format, **options):
+    # Deprecated formats are cast as before to warn on use
+    if format.startswith('fmt:'):
+        return partial(cast_date, format, **options)
+    if format == 'any':
+        # Zero-padded ISO values are parsed the same way by dateutil
+        parse_value = _parse_any
+    else:
+        pattern = _DEFAULT_PATTERN if format == 'default' else format
+        parse_value = create_datetime_parser(pattern)
+
+    def cast(value):
+        if not isinstance(value, six.string_types):
+            return cast_date(format, value, **options)
+        try:
+            return parse_value(value).date()
+        except Exception:
+            return ERROR
+
+    return cast
+
+
 # Internal
 
 _DEFAULT_PATTERN = '%Y-%m-%d'
+_parse_default = create_datetime_parser(_DEFAULT_PATTERN)
+
+
+def _parse_any(value):
+    if _ANY_FAST_PATTERN.match(value):
+        try:
+            return _parse_default(value)
+        except ValueError:
+            pass
+    return parse(value)
+
+
+_ANY_FAST_PATTERN = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}\Z')
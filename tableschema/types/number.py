@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 
 import re
 import six
+from functools import partial
 from decimal import Decimal
 from ..config import ERROR
 
@@ -13,21 +14,18 @@ from ..config import ERROR
 # Module API
 
 def cast_number(format, value, **options):
+    if options.get('floatNumber', _DEFAULT_FLOAT_NUMBER):
+        return _cast_float(format, value, **options)
     if isinstance(value, six.string_types):
         group_char = options.get('groupChar', _DEFAULT_GROUP_CHAR)
         decimal_char = options.get('decimalChar', _DEFAULT_DECIMAL_CHAR)
         value = _RE_WHITESPACE.sub('', value)
-        if decimal_char != '.':
-            if group_char:
-                value = value.replace(decimal_char, '__decimal_char__')
-                value = value.replace(group_char, '')
-                value = value.replace('__decimal_char__', '.')
-            else:
-                value = value.replace(decimal_char, '__decimal_char__')
-                value = value.replace('__decimal_char__', '.')
-        elif group_char:
+        # If the group char is the same as the decimal char
+        # the decimal char wins unless it's "."
+        if group_char and (group_char != decimal_char or decimal_char == '.'):
             value = value.replace(group_char, '')
-                
+        if decimal_char != '.':
+            value = value.replace(decimal_char, '.')
         if not options.get('bareNumber', _DEFAULT_BARE_NUMBER):
             value = _RE_BARE_NUMBER.sub('', value)
     elif isinstance(value, Decimal):
@@ -45,10 +43,74 @@ def cast_number(format, value, **options):
     return value
 
 
+def compile_number(format, **options):
+    group_char = options.get('groupChar', _DEFAULT_GROUP_CHAR)
+    decimal_char = options.get('decimalChar', _DEFAULT_DECIMAL_CHAR)
+    bare_number = options.get('bareNumber', _DEFAULT_BARE_NUMBER)
+    float_number = options.get('floatNumber', _DEFAULT_FLOAT_NUMBER)
+    if not decimal_char:
+        if not float_number:
+            return partial(cast_number, format, **options)
+        return partial(_cast_float, format, **options)
+
+    # The same as the replaces of `cast_number`
+    remove_group = bool(group_char) and (group_char != decimal_char or decimal_char == '.')
+    replace_decimal = decimal_char != '.'
+    # Strings of these chars have no whitespace to remove
+    clean_chars = frozenset('0123456789.eE+-' + decimal_char + group_char)
+    if _RE_WHITESPACE.search(decimal_char + group_char):
+        clean_chars = frozenset()
+    convert = float if float_number else Decimal
+    string_types = six.string_types
+
+    def cast(value):
+        if isinstance(value, string_types):
+            if not clean_chars.issuperset(value):
+                value = _RE_WHITESPACE.sub('', value)
+            if remove_group:
+                value = value.replace(group_char, '')
+            if replace_decimal:
+                value = value.replace(decimal_char, '.')
+            if not bare_number and not (value[:1].isdecimal() and value[-1:].isdecimal()):
+                value = _RE_BARE_NUMBER.sub('', value)
+        elif isinstance(value, Decimal):
+            if float_number:
+                return _convert_float(value)
+            return value
+        elif value is True or value is False:
+            return ERROR
+        elif not isinstance(value, six.integer_types + (float,)):
+            return ERROR
+        else:
+            value = str(value)
+        try:
+            return convert(value)
+        except Exception:
+            if float_number:
+                # Decimal accepts more (e.g. underscores or NaN payloads)
+                return _convert_float(cast_number(format, value))
+            return ERROR
+
+    return cast
+
+
 # Internal
 
+def _cast_float(format, value, **options):
+    options['floatNumber'] = False
+    return _convert_float(cast_number(format, value, **options))
+
+
+def _convert_float(value):
+    try:
+        return float(value)
+    except Exception:
+        return ERROR
+
+
 _RE_WHITESPACE = re.compile(r'\s')
 _RE_BARE_NUMBER = re.compile(r'((^\D*)|(\D*$))')
 _DEFAULT_GROUP_CHAR = ''
 _DEFAULT_DECIMAL_CHAR = '.'
 _DEFAULT_BARE_NUMBER = True
+_DEFAULT_FLOAT_NUMBER = False
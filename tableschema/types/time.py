@@ -4,10 +4,13 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import re
 import six
 import warnings
 from datetime import datetime, time
+from functools import partial
 from dateutil.parser import parse
+from ..helpers import create_datetime_parser
 from ..config import ERROR
 
 
@@ -19,7 +22,7 @@ def cast_time(format, value, **options):
             return ERROR
         try:
             if format == 'default':
-                value = datetime.strptime(value, _DEFAULT_PATTERN).time()
+                value = _parse_default(value).time()
             elif format == 'any':
                 value = parse(value).time()
             else:
@@ -35,6 +38,43 @@ def cast_time(format, value, **options):
     return value
 
 
+def compile_time(format, **options):
+    # Deprecated formats are cast as before to warn on use
+    if format.startswith('fmt:'):
+        return partial(cast_time, format, **options)
+    if format == 'any':
+        # Zero-padded ISO values are parsed the same way by dateutil
+        parse_value = _parse_any
+    else:
+        pattern = _DEFAULT_PATTERN if format == 'default' else format
+        parse_value = create_datetime_parser(pattern)
+
+    def cast(value):
+        if isinstance(value, time):
+            return value
+        if not isinstance(value, six.string_types):
+            return ERROR
+        try:
+            return parse_value(value).time()
+        except Exception:
+            return ERROR
+
+    return cast
+
+
 # Internal
 
 _DEFAULT_PATTERN = '%H:%M:%S'
+_parse_default = create_datetime_parser(_DEFAULT_PATTERN)
+
+
+def _parse_any(value):
+    if _ANY_FAST_PATTERN.match(value):
+        try:
+            return _parse_default(value)
+        except ValueError:
+            pass
+    return parse(value)
+
+
+_ANY_FAST_PATTERN = re.compile(r'[0-9]{2}:[0-9]{2}:[0-9]{2}\Z')
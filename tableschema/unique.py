@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import math
+import heapq
+import pickle
+import marshal
+import struct
+import hashlib
+import tempfile
+from array import array
+from decimal import Decimal
+from datetime import date, datetime, time, timezone
+from . import config
+
+
+# Module API
+
+class MemoryUniqueChecker(object):
+    """Unique checker keeping all the keys in memory (default)
+
+    A unique checker is created for every unique constraint (including
+    primary key) by `table.iter`. It must implement `add` and `close`
+    methods to be used as a custom `unique_check` implementation.
+
+    Keys are not stored as Python objects. Every key is serialized to bytes
+    appended to a single buffer and its 64-bit hash is stored in an
+    array-backed open-addressing table. If hashes match the stored key is
+    deserialized and compared using `==` so keys are duplicates exactly
+    as they would be in a Python set.
+
+    # Arguments
+        capacity (int): initial number of table slots (power of two)
+
+    """
+
+    # Public
+
+    def __init__(self, capacity=1024):
+        self.__hashes = array('Q', bytes(8 * capacity))
+        self.__slots = array('Q', bytes(8 * capacity))
+        self.__mask = capacity - 1
+        self.__keys = bytearray()
+        self.__ends = array('Q', [0])
+        self.__objects = {}
+
+    def add(self, key, row_number):
+        """Add a key
+
+        # Arguments
+            key (tuple): cast values of the unique fields
+            row_number (int): row number
+
+        # Returns
+            bool: true if the key is a duplicate
+
+        """
+        try:
+            digest = (hash(key) & _HASH_MASK) or 1
+        except TypeError:
+            key = tuple(map(normalize_value, key))
+            digest = (hash(key) & _HASH_MASK) or 1
+        hashes = self.__hashes
+        mask = self.__mask
+        index = digest & mask
+        while True:
+            slot = hashes[index]
+            if not slot:
+                break
+            if slot == digest and self.__get_key(self.__slots[index]) == key:
+                return True
+            index = (index + 1) & mask
+        encoded = _encode_key(key)
+        if encoded is None:
+            # Not serializable keys are kept as objects
+            self.__objects[len(self.__ends)] = key
+            encoded = b''
+        self.__keys += encoded
+        self.__ends.append(len(self.__keys))
+        hashes[index] = digest
+        self.__slots[index] = len(self.__ends) - 1
+        if len(self.__ends) * 3 > len(hashes) * 2:
+            self.__resize()
+        return False
+
+    def close(self, iter_keys=None):
+        """Finish checking
+
+        # Arguments
+            iter_keys (func):
+                returns an iterator of `(key, row_number)` pairs
+                for a second pass over the table (if needed)
+
+        # Returns
+            tuple[]: `(row_number, key)` pairs of duplicates
+                not reported by `add` sorted by row number
+
+        """
+        return []
+
+    # Private
+
+    def __get_key(self, number):
+        if number in self.__objects:
+            return self.__objects[number]
+        return _decode_key(self.__keys[self.__ends[number - 1]:self.__ends[number]])
+
+    def __resize(self):
+        hashes = self.__hashes
+        slots = self.__slots
+        capacity = len(hashes) * 2
+        mask = capacity - 1
+        self.__hashes = array('Q', bytes(8 * capacity))
+        self.__slots = array('Q', bytes(8 * capacity))
+        self.__mask = mask
+        for digest, number in zip(hashes, slots):
+            if digest:
+                index = digest & mask
+                while self.__hashes[index]:
+                    index = (index + 1) & mask
+                self.__hashes[index] = digest
+                self.__slots[index] = number
+
+
+class DiskUniqueChecker(object):
+    """Unique checker with a bounded memory usage
+
+    Keys are hashed to fixed-width digests. Once there are more than
+    `buffer_size` digests in memory they are sorted and spilled to a temporary
+    file along with the serialized keys. Duplicates within the in-memory
+    buffer are reported by `add`; duplicates between spilled runs are found
+    by merging the runs on `close`.
+
+    # Arguments
+        buffer_size (int): max number of digests kept in memory
+        directory (str): directory for temporary files
+
+    """
+
+    # Public
+
+    def __init__(self, buffer_size=config.DEFAULT_UNIQUE_BUFFER_SIZE, directory=None):
+        self.__buffer_size = buffer_size
+        self.__directory = directory
+        self.__buffer = {}
+        self.__runs = []
+
+    def add(self, key, row_number):
+        digest = create_key_digest(key)
+        if digest in self.__buffer:
+            return True
+        self.__buffer[digest] = (row_number, _encode_key(key) or b'')
+        if len(self.__buffer) >= self.__buffer_size:
+            self.__spill()
+        return False
+
+    def close(self, iter_keys=None):
+        try:
+            runs = [_iter_run(run) for run in self.__runs]
+            runs.append(_iter_buffer(self.__buffer))
+            duplicates = []
+            previous = None
+            for digest, row_number, encoded in heapq.merge(*runs):
+                if digest == previous:
+                    key = _decode_key(encoded) if encoded else None
+                    duplicates.append((row_number, key))
+                previous = digest
+            return sorted(duplicates, key=_get_row_number)
+        finally:
+            for run in self.__runs:
+                run.close()
+            self.__runs = []
+            self.__buffer = {}
+
+    # Private
+
+    def __spill(self):
+        run = tempfile.TemporaryFile(dir=self.__directory)
+        for digest, row_number, encoded in _iter_buffer(self.__buffer):
+            run.write(_RUN_RECORD.pack(digest, row_number, len(encoded)))
+            run.write(encoded)
+        run.seek(0)
+        self.__runs.append(run)
+        self.__buffer = {}
+
+
+class BloomUniqueChecker(object):
+    """Unique checker with a fixed memory usage
+
+    Keys are added to a Bloom filter sized for `capacity` keys. A key
+    the filter may have seen is kept as a suspect and its next occurrences
+    are reported as duplicates by `add`. Suspects themselves are verified
+    on `close` by a second pass over the table so a false positive of
+    the filter is never reported as a duplicate.
+
+    At most `suspects_size` suspects are kept in memory. If there are more
+    (the table has many duplicates or more keys than `capacity`) the
+    second pass checks the keys the suspects don't cover
+    using `DiskUniqueChecker`.
+
+    # Arguments
+        capacity (int): expected number of keys
+        error_rate (float): false positive rate for `capacity` keys
+        suspects_size (int): max number of suspects kept in memory
+
+    """
+
+    # Public
+
+    def __init__(self, capacity=config.DEFAULT_BLOOM_CAPACITY,
+                 error_rate=config.DEFAULT_BLOOM_ERROR_RATE,
+                 suspects_size=config.DEFAULT_BLOOM_SUSPECTS_SIZE):
+        size = int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.__size = max(size, 8)
+        self.__hash_count = max(int(round(self.__size / capacity * math.log(2))), 1)
+        self.__bits = bytearray((self.__size + 7) // 8)
+        self.__suspects = {}
+        self.__suspects_size = suspects_size
+        self.__overflow = False
+
+    def add(self, key, row_number):
+        try:
+            first_hash = hash(key)
+        except TypeError:
+            key = tuple(map(normalize_value, key))
+            first_hash = hash(key)
+        if key in self.__suspects:
+            return True
+        second_hash = hash((first_hash, key)) | 1
+        bits = self.__bits
+        size = self.__size
+        seen = True
+        for number in range(self.__hash_count):
+            index = (first_hash + number * second_hash) % size
+            mask = 1 << (index & 7)
+            if not bits[index >> 3] & mask:
+                bits[index >> 3] |= mask
+                seen = False
+        if seen:
+            if len(self.__suspects) < self.__suspects_size:
+                self.__suspects[key] = row_number
+            else:
+                self.__overflow = True
+        return False
+
+    def close(self, iter_keys=None):
+        suspects = self.__suspects
+        self.__suspects = {}
+        duplicates = []
+        if self.__overflow and iter_keys is not None:
+            # Occurrences of a suspect after it have been reported by `add`
+            checker = DiskUniqueChecker()
+            for key, row_number in iter_keys():
+                try:
+                    suspect_row_number = suspects.get(key)
+                except TypeError:
+                    suspect_row_number = suspects.get(tuple(map(normalize_value, key)))
+                if suspect_row_number is not None and row_number > suspect_row_number:
+                    continue
+                if checker.add(key, row_number):
+                    duplicates.append((row_number, key))
+            duplicates.extend(checker.close())
+        elif suspects and iter_keys is not None:
+            last_row_number = max(suspects.values())
+            for key, row_number in iter_keys():
+                if row_number >= last_row_number:
+                    break
+                try:
+                    suspect_row_number = suspects.get(key)
+                except TypeError:
+                    suspect_key = tuple(map(normalize_value, key))
+                    suspect_row_number = suspects.get(suspect_key)
+                else:
+                    suspect_key = key
+                if suspect_row_number is not None and row_number < suspect_row_number:
+                    duplicates.append((suspects.pop(suspect_key), key))
+        return sorted(duplicates, key=_get_row_number)
+
+
+def create_key_digest(key):
+    """Create a fixed-width digest for a key
+
+    Equal keys of the same type get the same digest
+    (e.g. `Decimal('1.0')` and `Decimal('1.00')` or timezone aware
+    datetimes of the same instant).
+
+    # Arguments
+        key (tuple): cast values
+
+    # Returns
+        bytes: 16 bytes digest
+
+    """
+    encoded = repr(tuple(map(normalize_value, key))).encode('utf-8')
+    return hashlib.blake2b(encoded, digest_size=_DIGEST_SIZE).digest()
+
+
+def normalize_value(value):
+    """Normalize a cast value
+
+    Equal values of the same type get the same form (e.g. `Decimal('-0')`
+    and `Decimal('0')` or timezone aware datetimes of the same instant).
+    Not hashable dicts and lists are converted to JSON strings.
+
+    # Arguments
+        value (any): cast value
+
+    # Returns
+        any: normalized value
+
+    """
+    if isinstance(value, Decimal):
+        return value.normalize() if value else Decimal(0)
+    if isinstance(value, float):
+        return value if value else 0.0
+    if isinstance(value, datetime):
+        if value.utcoffset() is not None:
+            return value.astimezone(timezone.utc)
+        return value
+    if isinstance(value, time):
+        if value.utcoffset() is not None:
+            return (datetime.combine(_TIME_DATE, value.replace(tzinfo=None)) -
+                    value.utcoffset())
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True, default=str)
+    return value
+
+
+UNIQUE_CHECKERS = {
+    'memory': MemoryUniqueChecker,
+    'disk': DiskUniqueChecker,
+    'bloom': BloomUniqueChecker,
+}
+
+
+# Internal
+
+_DIGEST_SIZE = 16
+_HASH_MASK = (1 << 64) - 1
+_MARSHAL_VERSION = 2
+_RUN_RECORD = struct.Struct('>%ssQI' % _DIGEST_SIZE)
+_PICKLE_PROTOCOL = 2
+_PICKLE_ERRORS = (pickle.PicklingError, TypeError, AttributeError)
+_TIME_DATE = date(2000, 1, 1)
+
+
+def _encode_key(key):
+    # Pickles start with the protocol opcode which is not a marshal type code
+    try:
+        return marshal.dumps(key, _MARSHAL_VERSION)
+    except ValueError:
+        try:
+            return pickle.dumps(key, _PICKLE_PROTOCOL)
+        except _PICKLE_ERRORS:
+            return None
+
+
+def _decode_key(encoded):
+    if encoded[0] == pickle.PROTO[0]:
+        return pickle.loads(encoded)
+    return marshal.loads(encoded)
+
+
+def _iter_buffer(buffer):
+    for digest, (row_number, encoded) in sorted(buffer.items()):
+        yield (digest, row_number, encoded)
+
+
+def _iter_run(run):
+    while True:
+        record = run.read(_RUN_RECORD.size)
+        if not record:
+            break
+        digest, row_number, size = _RUN_RECORD.unpack(record)
+        yield (digest, row_number, run.read(size))
+
+
+def _get_row_number(duplicate):
+    return duplicate[0]
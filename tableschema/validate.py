@@ -4,7 +4,12 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import six
+import json
+import time
+from multiprocessing import Pool
 from .schema import Schema
+from .table import Table
 
 
 # Module API
@@ -25,3 +30,119 @@ def validate(descriptor):
     """
     Schema(descriptor, strict=True)
     return True
+
+
+def validate_tables(tables, workers=None, **options):
+    """Validate data tables against their schemas
+
+    Tables are validated in a pool of processes; every process validates
+    one table at a time and reuses schemas it has already loaded
+    during this call.
+    Reports are yielded as soon as tables are validated (so not
+    necessarily in the order of `tables`):
+
+    ```python
+    {
+        'index': 0,
+        'source': 'data.csv',
+        'valid': False,
+        'row_count': 100,
+        'errors': [
+            {'row_number': 3, 'type': 'CastError', 'message': '...'},
+        ],
+        'time': 0.05,
+    }
+    ```
+
+    # Arguments
+        tables (tuple[]): list of `(source, schema)` pairs where schema is
+            in any form supported by `Schema` class
+        workers (int): number of processes (by default the CPU count);
+            if it's 1 tables are validated in the current process
+        options (dict): `Table` options applied to every table (e.g. `encoding`)
+
+    # Returns
+        Iterator[dict]: yields validation reports
+
+    """
+    tasks = []
+    for index, (source, schema) in enumerate(tables):
+        if isinstance(schema, Schema):
+            schema = schema._current_descriptor
+        tasks.append((index, source, schema, options))
+
+    # Validate (in-process)
+    if workers == 1:
+        schemas = {}
+        for task in tasks:
+            yield _validate_table(task, schemas)
+        return
+
+    # Validate (pool)
+    pool = Pool(workers, initializer=_init_validate_worker)
+    try:
+        for report in pool.imap_unordered(_validate_table_in_worker, tasks):
+            yield report
+    finally:
+        pool.terminate()
+
+
+# Internal
+
+def _validate_table(task, schemas):
+    index, source, schema, options = task
+    start = time.time()
+    errors = []
+    row_count = 0
+
+    # Collect errors
+    def exc_handler(exc, row_number=None, row_data=None, error_data=None):
+        for error in getattr(exc, 'errors', None) or [exc]:
+            errors.append({
+                'row_number': row_number,
+                'type': type(error).__name__,
+                'message': str(error),
+            })
+
+    # Validate table
+    try:
+        schema = _get_schema(schema, schemas)
+        for error in schema.errors:
+            exc_handler(error)
+        # Invalid schema fields can't be used for casting
+        if schema.valid:
+            table = Table(source, schema=schema, **options)
+            for row_count, _ in enumerate(table.iter(exc_handler=exc_handler), start=1):
+                pass
+    except Exception as exception:
+        exc_handler(exception)
+
+    return {
+        'index': index,
+        'source': source if isinstance(source, six.string_types) else None,
+        'valid': not errors,
+        'row_count': row_count,
+        'errors': errors,
+        'time': round(time.time() - start, 3),
+    }
+
+
+def _get_schema(descriptor, schemas):
+    key = descriptor
+    if not isinstance(key, six.string_types):
+        key = json.dumps(descriptor, sort_keys=True, default=str)
+    if key not in schemas:
+        schemas[key] = Schema(descriptor)
+    return schemas[key]
+
+
+def _init_validate_worker():
+    # Schemas are cached per worker so they live as long as the pool
+    _VALIDATE_WORKER['schemas'] = {}
+
+
+def _validate_table_in_worker(task):
+    return _validate_table(task, _VALIDATE_WORKER['schemas'])
+
+
+_VALIDATE_WORKER = {}
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import pytest
+import datetime
+from decimal import Decimal
+from tableschema import Field, Table, FailedCast, exceptions
+numpy = pytest.importorskip('numpy')
+
+
+# Tests
+
+@pytest.mark.parametrize('descriptor, values', [
+    ({'type': 'integer'}, ['1', '-2', '+3', ' 4', '1_000', 'bad', '', 5, '99999999999999999999']),
+    ({'type': 'integer', 'bareNumber': False}, ['1$', '-2', '3']),
+    ({'type': 'number'}, ['1', '-2.5', '.5', '1e3', 'NaN', 'bad', '', '1 000']),
+    ({'type': 'number', 'groupChar': '.', 'decimalChar': ','}, ['1.500', '1,5']),
+    ({'type': 'number', 'floatNumber': True}, ['1', '-2.5', '.5', '1e3', 'bad', '', '1 000']),
+    ({'type': 'boolean'}, ['true', 'False', ' 1 ', 'yes', '', True]),
+    ({'type': 'boolean', 'trueValues': ['yes']}, ['yes', 'true', 'false']),
+    ({'type': 'date'}, ['2020-01-02', '2020-02-30', '0000-01-01', '2020-1-2', 'bad', '']),
+    ({'type': 'datetime'}, ['2020-01-02T10:20:30Z', '2020-01-02T24:00:00Z', '2020-01-02t10:20:30z', '']),
+    ({'type': 'date', 'constraints': {'minimum': '2020-01-01'}}, ['2020-01-02', '2019-01-02']),
+    ({'type': 'string'}, ['a', '', 'b']),
+])
+def test_cast_many_matches_scalar_backend(descriptor, values):
+    field = Field(dict(descriptor, name='name'))
+    expect_values, expect_errors = field.cast_many(values)
+    actual_values, actual_errors = field.cast_many(values, backend='numpy')
+    assert list(map(repr, actual_values)) == list(map(repr, expect_values))
+    assert list(actual_errors) == list(expect_errors)
+    for index, error in actual_errors.items():
+        assert str(error) == str(expect_errors[index])
+
+
+def test_cast_many_types():
+    field = Field({'name': 'name', 'type': 'datetime'})
+    values, errors = field.cast_many(['2020-01-02T10:20:30Z'], backend='numpy')
+    assert values == [datetime.datetime(2020, 1, 2, 10, 20, 30)]
+    field = Field({'name': 'name', 'type': 'number'})
+    values, errors = field.cast_many(['1.10'], backend='numpy')
+    assert values == [Decimal('1.10')]
+    assert str(values[0]) == '1.10'
+
+
+def test_cast_many_not_supported_backend():
+    field = Field({'name': 'name', 'type': 'integer'})
+    with pytest.raises(exceptions.TableSchemaException):
+        field.cast_many(['1'], backend='bad')
+
+
+def test_table_read_backend_numpy():
+    source = [['id', 'date'], ['1', '2020-01-02'], ['bad', '2020-01-03']]
+    schema = {'fields': [
+        {'name': 'id', 'type': 'integer'},
+        {'name': 'date', 'type': 'date'},
+    ]}
+    errors = []
+    def handler(exc, row_number, row_data, error_data):
+        errors.append((exc, row_number, row_data, error_data))
+    table = Table(source, schema=schema, backend='numpy')
+    rows = table.read(exc_handler=handler)
+    assert rows == [
+        [1, datetime.date(2020, 1, 2)],
+        ['bad', datetime.date(2020, 1, 3)],
+    ]
+    assert isinstance(rows[1][0], FailedCast)
+    assert len(errors) == 1
+    assert errors[0][1] == 3
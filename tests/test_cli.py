@@ -5,10 +5,11 @@ from __future__ import print_function
 
 import os
 import ast
+import json
 import pytest
 from click.testing import CliRunner
 from tableschema import Schema
-from tableschema.cli import infer, validate
+from tableschema.cli import infer, validate, validate_tables
 os.environ['LC_ALL'] = 'en_US.UTF-8'
 
 
@@ -68,3 +69,19 @@ def test_infer_schema_greek_no_encoding_defined():
     result = runner.invoke(cli.infer, ['data/data_infer_iso-8859-7.csv'])
     # There's an exception in the result
     assert 'Could not decode the data file as utf-8.' in result.output
+
+
+def test_validate_tables(tmpdir):
+    manifest = str(tmpdir.join('manifest.json'))
+    with open(manifest, 'w') as file:
+        json.dump([['data/data_infer.csv', {'fields': [
+            {'name': 'id', 'type': 'integer'},
+            {'name': 'age', 'type': 'integer'},
+            {'name': 'name', 'type': 'integer'},
+        ]}]], file)
+    runner = CliRunner()
+    result = runner.invoke(validate_tables, [manifest, '--workers', '1'])
+    report = json.loads(result.output.splitlines()[0])
+    assert report['valid'] is False
+    assert len(report['errors']) == 4
+    assert result.exit_code == 1
@@ -71,6 +71,59 @@ def test_cast_value_null_with_missing_values():
     assert field.cast_value('null') == None
 
 
+def test_compiled_cast_function():
+    cast = Field(DESCRIPTOR_MAX, missing_values=['', 'NA']).compiled_cast_function
+    assert cast('1') == 1
+    assert cast(1) == 1
+    with pytest.raises(exceptions.CastError) as excinfo:
+        cast('NA')
+    assert 'constraint "required"' in str(excinfo.value)
+    with pytest.raises(exceptions.CastError) as excinfo:
+        cast('string')
+    assert 'can\'t cast value "string"' in str(excinfo.value)
+
+
+def test_compiled_cast_function_unhashable_value():
+    cast = Field({'name': 'name', 'type': 'object'}).compiled_cast_function
+    assert cast({'key': 'value'}) == {'key': 'value'}
+    assert cast('') == None
+
+
+def test_cast_many():
+    field = Field(DESCRIPTOR_MAX)
+    assert field.cast_many(['1', '2']) == ([1, 2], {})
+    values, errors = field.cast_many(['1', 'bad', '', '4'])
+    assert values == [1, 'bad', '', 4]
+    assert list(errors) == [1, 2]
+    assert all(isinstance(error, exceptions.CastError) for error in errors.values())
+
+
+def test_cast_many_constraints_false():
+    assert Field(DESCRIPTOR_MAX).cast_many(['1', ''], constraints=False) == ([1, None], {})
+
+
+def test_cast_value_cache():
+    field = Field({'name': 'name', 'type': 'integer', 'constraints': {'maximum': 5}},
+                  cache_size=2)
+    for _ in range(3):
+        assert field.cast_value('1') == 1
+        assert field.cast_value('') == None
+        assert field.compiled_cast_function('2') == 2
+        assert field.cast_value('9', constraints=False) == 9
+        with pytest.raises(exceptions.CastError) as excinfo:
+            field.cast_value('9')
+        assert 'constraint "maximum"' in str(excinfo.value)
+        with pytest.raises(exceptions.CastError):
+            field.compiled_cast_function('bad')
+    # low hit rate disables the cache
+    assert [field.cast_value(str(value)) for value in range(6)] == list(range(6))
+
+
+def test_cast_value_cache_mutable_type():
+    field = Field({'name': 'name', 'type': 'object'}, cache_size=10)
+    assert field.cast_value('{"a": 1}') is not field.cast_value('{"a": 1}')
+
+
 def test_test_value():
     assert Field(DESCRIPTOR_MAX).test_value('1') == True
     assert Field(DESCRIPTOR_MAX).test_value('string') == False
@@ -110,6 +163,15 @@ def test_number_missingValues():
     assert cast('N/A') == None
 
 
+def test_number_float():
+    field = Field({'name': 'name', 'type': 'number', 'floatNumber': True,
+                   'constraints': {'minimum': '1.5'}})
+    assert field.cast_value('2.5') == 2.5
+    assert type(field.cast_value('2.5')) is float
+    with pytest.raises(exceptions.CastError):
+        field.cast_value('1')
+
+
 # Tests [constraints]
 
 def test_test_value_required():
@@ -167,6 +229,19 @@ def test_test_value_enum():
     assert test(4) == False
 
 
+def test_test_value_enum_unhashable():
+    field = Field({
+        'name': 'name',
+        'type': 'object',
+        'constraints': {'enum': [{'a': 1}, '{"b": 2}']}
+    }, missing_values=['', {}])
+    test = partial(field.test_value, constraints=['enum'])
+    assert test({'a': 1}) == True
+    assert test('{"b": 2}') == True
+    assert test({'a': 2}) == False
+    assert field.cast_value({}) == None
+
+
 def test_test_value_minimum():
     field = Field({
         'name': 'name',
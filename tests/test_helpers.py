@@ -7,6 +7,7 @@ from __future__ import unicode_literals
 import os
 import io
 import pytest
+from datetime import datetime
 from tableschema import exceptions, helpers
 
 
@@ -36,3 +37,49 @@ def test_retrieve_descriptor_invalid():
     source = 'data/data_infer.csv'
     with pytest.raises(exceptions.LoadError):
         helpers.retrieve_descriptor(source)
+
+
+@pytest.mark.parametrize('pattern, value', [
+    ('%Y-%m-%d', '2019-01-31'),
+    ('%Y-%m-%d', '2019-1-2'),
+    ('%Y-%m-%d', '2019-02-30'),
+    ('%Y-%m-%d', '2019-01-31 '),
+    ('%d/%m/%y', '31/12/69'),
+    ('%d/%m/%y', '31/12/68'),
+    ('%Y-%m-%d', '2019-W01-1'),
+    ('%Y-%m-%d', '20190131'),
+    ('%Y-%m-%dT%H:%M:%SZ', '2019-01-31T10:20:30Z'),
+    ('%Y-%m-%dT%H:%M:%SZ', '2019-01-31T10:20:30z'),
+    ('%Y-%m-%dT%H:%M:%SZ', '2019-01-31T10:20:30+01:00'),
+    ('%Y-%m-%dT%H:%M:%S', '2019-01-31T10:20:30.500'),
+    ('%Y-%m-%d %H:%M:%S', '2019-01-31 10:20:30'),
+    ('%H:%M:%S', '10:20:30'),
+    ('%H:%M:%S', '24:00:00'),
+    ('%H:%M:%S.%f', '10:20:30.5'),
+    ('%H:%M:%S', '10:20:60'),
+    ('%d %m  %Y', '31 \t12 2019'),
+    ('%Y (%m) %%', '2019 (12) %'),
+    ('%Y %B', '2019 December'),
+])
+def test_create_datetime_parser(pattern, value):
+    try:
+        expect = datetime.strptime(value, pattern)
+    except ValueError:
+        expect = ValueError
+    try:
+        actual = helpers.create_datetime_parser(pattern)(value)
+    except ValueError:
+        actual = ValueError
+    assert actual == expect
+
+
+def test_value_set():
+    values = helpers.ValueSet(['a', 1, {'b': 2}, [3]])
+    assert 'a' in values
+    assert 1.0 in values
+    assert {'b': 2} in values
+    assert [3] in values
+    assert 'b' not in values
+    assert {'b': 3} not in values
+    assert len(values) == 4
+    assert list(values) == ['a', 1, {'b': 2}, [3]]
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import pytest
+from decimal import Decimal
+from datetime import datetime, time, timedelta, timezone
+from tableschema import ForeignKeyIndex, Table, exceptions
+
+
+# Fixtures
+
+UTC_PLUS_ONE = timezone(timedelta(hours=1))
+
+SOURCE = [
+    ['id', 'name'],
+    ['1', 'Alex'],
+    ['2', 'John'],
+    ['1', 'Walter'],
+]
+SCHEMA = {
+    'fields': [
+        {'name': 'id', 'type': 'integer'},
+        {'name': 'name', 'type': 'string'},
+    ],
+}
+
+
+# Tests
+
+def test_foreign_key_index():
+    index = ForeignKeyIndex(Table(SOURCE, schema=SCHEMA), ['id'])
+    assert index.fields == ['id']
+    assert len(index) == 2
+    assert index.get((1,)) == {'id': 1, 'name': 'Alex'}
+    assert index.get((2,)) == {'id': 2, 'name': 'John'}
+    assert index.get((3,)) is None
+    assert (2,) in index
+    assert (3,) not in index
+
+
+def test_foreign_key_index_rows():
+    index = ForeignKeyIndex(Table(SOURCE, schema=SCHEMA), ['id'])
+    assert index[(2,)] == {'id': 2, 'name': 'John'}
+    assert index[(1,)] == {'id': 1, 'name': 'Alex'}
+    with pytest.raises(KeyError):
+        index[(3,)]
+
+
+def test_foreign_key_index_rows_not_in_order():
+    rows = [{'id': 1}, {'id': 2}, {'id': 3}]
+    index = ForeignKeyIndex(rows, ['id'])
+    assert [index[(key,)] for key in [1, 3, 2]] == [{'id': 1}, {'id': 3}, {'id': 2}]
+
+
+def test_foreign_key_index_closes_source():
+    closed = []
+    class Source(object):
+        def iter(self, keyed):
+            try:
+                yield {'id': 1}
+                yield {'name': 'Alex'}
+                yield {'id': 2}
+            finally:
+                closed.append(True)
+    with pytest.raises(KeyError):
+        ForeignKeyIndex(Source(), ['id'])
+    assert closed == [True]
+
+
+def test_foreign_key_index_keyed_rows():
+    rows = [{'id': [1], 'name': 'Alex'}, {'id': [2], 'name': 'John'}]
+    index = ForeignKeyIndex(rows, ['id'])
+    assert index.get(([2],)) == {'id': [2], 'name': 'John'}
+    assert index[([1],)] == {'id': [1], 'name': 'Alex'}
+
+
+def test_foreign_key_index_equal_keys():
+    rows = [
+        {'id': Decimal('-0')},
+        {'id': Decimal('1.50')},
+        {'id': datetime(2020, 1, 1, 10, tzinfo=timezone.utc)},
+        {'id': time(10, tzinfo=timezone.utc)},
+    ]
+    index = ForeignKeyIndex(rows, ['id'])
+    keys = [
+        (0,),
+        (-0.0,),
+        (1.5,),
+        (datetime(2020, 1, 1, 11, tzinfo=UTC_PLUS_ONE),),
+        (time(11, tzinfo=UTC_PLUS_ONE),),
+    ]
+    mapping = dict(((row['id'],), row) for row in rows)
+    assert [key in index for key in keys] == [key in mapping for key in keys] == [True] * 5
+    assert (datetime(2020, 1, 1, 10),) not in index
+    assert ('0',) not in index
+
+
+def test_foreign_key_index_save_load(tmpdir):
+    path = str(tmpdir.join('index.db'))
+    ForeignKeyIndex(Table(SOURCE, schema=SCHEMA), ['id']).save(path)
+    index = ForeignKeyIndex.load(path)
+    assert index.fields == ['id']
+    assert len(index) == 2
+    assert index.get((Decimal('2.0'),)) == {'id': 2, 'name': 'John'}
+    assert index.get((3,)) is None
+    assert index[(1,)] == {'id': 1, 'name': 'Alex'}
+    index.close()
+
+
+def test_foreign_key_index_path(tmpdir):
+    path = str(tmpdir.join('index.db'))
+    index = ForeignKeyIndex(Table(SOURCE, schema=SCHEMA), ['id'], path=path)
+    assert index.get((2,)) == {'id': 2, 'name': 'John'}
+    assert ForeignKeyIndex.load(path).get((1,)) == {'id': 1, 'name': 'Alex'}
+
+
+def test_foreign_key_index_load_not_index(tmpdir):
+    path = str(tmpdir.join('other.db'))
+    with pytest.raises(exceptions.TableSchemaException) as excinfo:
+        ForeignKeyIndex.load(path)
+    assert 'not a foreign key index' in str(excinfo.value)
@@ -91,3 +91,9 @@ def test_infer_increase_limit_issue_212():
         ],
         'missingValues': [''],
     }
+
+
+def test_infer_sample_stride():
+    descriptor = infer('data/data_infer_row_limit.csv', limit=4, sample='stride')
+    assert descriptor['fields'][0] == {
+        'name': 'id', 'type': 'string', 'format': 'default'}
@@ -7,11 +7,13 @@ from __future__ import unicode_literals
 import io
 import os
 import json
+import pickle
 import pytest
 import requests
+from copy import deepcopy
 from collections import OrderedDict
 from decimal import Decimal
-from tableschema import Schema, FailedCast, exceptions
+from tableschema import Schema, FailedCast, InferenceState, exceptions
 
 
 # Constants
@@ -120,6 +122,79 @@ def test_cast_row_wrong_type_multiple_errors():
     assert len(excinfo.value.errors) == 2
 
 
+def test_cast_row_compiled_and_generic_paths_match():
+    schema = Schema(DESCRIPTOR_MAX)
+    source = ['string', '10.0', '-', 'string', 'null']
+    target = ['string', Decimal(10.0), None, 'string', None]
+    assert schema.cast_row(source) == target
+    assert schema.cast_row(source, fail_fast=True) == target
+    source = ['', '10.0', '1', 'string', 'string']
+    with pytest.raises(exceptions.CastError) as excinfo:
+        schema.cast_row(source)
+    assert len(excinfo.value.errors) == 1
+    assert 'constraint "required"' in str(excinfo.value.errors[0])
+
+
+def test_cast_row_cache_size():
+    schema = Schema(DESCRIPTOR_MAX, cache_size=100)
+    assert schema.cache_size == 100
+    source = ['string', '10.0', '1', 'string', 'string']
+    target = ['string', Decimal(10.0), 1, 'string', 'string']
+    assert schema.cast_row(source) == target
+    assert schema.cast_row(source) == target
+    with pytest.raises(exceptions.CastError):
+        schema.cast_row(['', '10.0', '1', 'string', 'string'])
+
+
+def test_cast_row_preserve_missing_values(monkeypatch):
+    monkeypatch.setenv('TABLESCHEMA_PRESERVE_MISSING_VALUES', '1')
+    schema = Schema(DESCRIPTOR_MAX)
+    source = ['string', '-', 'null', 'string', '']
+    assert schema.cast_row(source) == source
+
+
+def test_cast_rows():
+    schema = Schema(DESCRIPTOR_MAX)
+    source = [
+        ['string', '10.0', '1', 'string', 'string'],
+        ['string', '-', '2', 'string'],
+        ['string', 'notdecimal', '3', 'string', 'string'],
+    ]
+    errors = []
+    def handler(exc, row_number, row_data, error_data):
+        errors.append((exc, row_number, row_data, error_data))
+    actual = schema.cast_rows(source, row_numbers=[2, 3, 4], exc_handler=handler)
+    assert actual == [
+        ['string', Decimal(10.0), 1, 'string', 'string'],
+        ['string', None, 2, 'string', None],
+        ['string', 'notdecimal', 3, 'string', 'string'],
+    ]
+    assert isinstance(actual[2][1], FailedCast)
+    assert [error[1] for error in errors] == [3, 4]
+    assert 'Row length' in str(errors[0][0])
+    assert 'There are 1 cast errors' in str(errors[1][0])
+
+
+def test_cast_columns():
+    schema = Schema(DESCRIPTOR_MIN)
+    columns, errors = schema.cast_columns([['a', 'b', 'c'], ['1', 'bad', '3']])
+    assert columns == [['a', 'b', 'c'], [1, 'bad', 3]]
+    assert list(errors) == [1]
+    assert list(errors[1]) == [1]
+    assert isinstance(errors[1][1], exceptions.CastError)
+
+
+def test_cast_columns_wrong_count():
+    with pytest.raises(exceptions.CastError):
+        Schema(DESCRIPTOR_MIN).cast_columns([['a', 'b']])
+
+
+def test_failed_cast_pickle():
+    value = pickle.loads(pickle.dumps(FailedCast('bad')))
+    assert isinstance(value, FailedCast)
+    assert value.value == 'bad'
+
+
 def test_missing_values():
     assert Schema(DESCRIPTOR_MIN).missing_values == ['']
     assert Schema(DESCRIPTOR_MAX).missing_values == ['', '-', 'null']
@@ -447,6 +522,132 @@ def test_schema_not_supported_type_issue_goodatbles_304():
     assert schema.fields[1] is False
 
 
+def test_infer_rows_iterator():
+    rows = (row for row in [['id', 'name'], ['1', 'Paul'], ['2', 'Jimmy']])
+    schema = Schema()
+    schema.infer(rows)
+    assert schema.descriptor['fields'] == [
+        {'format': 'default', 'name': 'id', 'type': 'integer'},
+        {'format': 'default', 'name': 'name', 'type': 'string'}]
+
+
+@pytest.mark.parametrize('value, type, format', [
+    ('1', 'integer', 'default'),
+    (' 2 ', 'integer', 'default'),
+    ('1_000', 'integer', 'default'),
+    ('1.5', 'number', 'default'),
+    ('NaN', 'number', 'default'),
+    ('P1D', 'duration', 'default'),
+    ('{"a": 1}', 'object', 'default'),
+    (' [1, 2]', 'array', 'default'),
+    ('90, 45', 'geopoint', 'default'),
+    ('01/02/2020', 'date', '%d/%m/%Y'),
+    ('20200101', 'date', '%Y%m%d'),
+    ('2020-01-01T10:00:00Z', 'datetime', 'default'),
+    ('10:00:00', 'time', 'default'),
+    ('true', 'boolean', 'default'),
+    ('text', 'string', 'default'),
+])
+def test_infer_type(value, type, format):
+    schema = Schema()
+    schema.infer([['field'], [value]])
+    assert schema.descriptor['fields'][0] == {
+        'name': 'field', 'type': type, 'format': format}
+
+
+def test_infer_candidates_elimination_confidence():
+    data = [['id']] + [[str(index)] for index in range(8)] + [['a'], ['b']]
+    schema = Schema()
+    schema.infer(data, confidence=0.75)
+    assert schema.descriptor['fields'][0]['type'] == 'integer'
+    schema = Schema()
+    schema.infer(data, confidence=0.9)
+    assert schema.descriptor['fields'][0]['type'] == 'string'
+
+
+def test_infer_workers():
+    data = [
+      ['id', 'age', 'name', 'dob'],
+      ['1','39','Paul','28/1/79'],
+      ['2','23','Jimmy','13/6/95'],
+      ['3','36','Jane','17/9/80'],
+      ['4','N/A','Judy','19/4/83', 'extra'],
+    ]
+    expect = Schema().infer(deepcopy(data))
+    assert Schema().infer(deepcopy(data), workers=2) == expect
+    assert Schema().infer(iter(deepcopy(data)), workers=2) == expect
+
+
+def test_infer_constraints():
+    data = [['id', 'kind', 'dob', 'note']]
+    for index in range(1, 21):
+        data.append([str(index), 'ab'[index % 2], '2020-01-%02d' % index, 'x' * (index % 5)])
+    schema = Schema()
+    schema.infer(deepcopy(data), infer_constraints=True)
+    assert schema.valid
+    assert schema.get_field('id').constraints == {
+        'required': True, 'unique': True, 'minimum': 1, 'maximum': 20}
+    assert schema.get_field('kind').constraints == {
+        'required': True, 'enum': ['b', 'a'], 'maxLength': 1}
+    assert schema.get_field('dob').constraints == {
+        'required': True, 'unique': True,
+        'minimum': '2020-01-01', 'maximum': '2020-01-20'}
+    assert schema.get_field('note').constraints == {
+        'enum': ['x', 'xx', 'xxx', 'xxxx'], 'maxLength': 4}
+    assert Schema().infer(deepcopy(data), infer_constraints=True, workers=2) == schema.descriptor
+    assert 'constraints' not in Schema().infer(deepcopy(data))['fields'][0]
+
+
+def test_infer_constraints_cast_values():
+    data = [['code']] + [[value] for value in ['1', '1', '1', '2', '02', '2', 'x']]
+    schema = Schema()
+    schema.infer(deepcopy(data), confidence=0.8, infer_constraints=True)
+    assert schema.get_field('code').type == 'integer'
+    assert schema.get_field('code').constraints == {
+        'required': True, 'enum': ['1', '2'], 'minimum': 1, 'maximum': 2}
+    assert all(schema.fields)
+    descriptor = Schema().infer([['id'], ['1'], ['01'], ['2']], infer_constraints=True)
+    assert 'unique' not in descriptor['fields'][0]['constraints']
+
+
+def test_infer_constraints_unique_many_values():
+    data = [['id']] + [[str(index)] for index in range(5000)]
+    descriptor = Schema().infer(data, infer_constraints=True)
+    assert descriptor['fields'][0]['constraints']['unique'] is True
+    # Many distinct values are not counted exactly
+    data = [['id']] + [[str(index % 19800)] for index in range(20000)]
+    descriptor = Schema().infer(data, infer_constraints=True)
+    assert 'unique' not in descriptor['fields'][0]['constraints']
+    data = [['id']] + [[str(index)] for index in range(20000)]
+    descriptor = Schema().infer(data, infer_constraints=True)
+    assert 'unique' not in descriptor['fields'][0]['constraints']
+
+
+def test_inference_state():
+    data = [
+      ['id', 'age', 'name', 'dob'],
+      ['1','39','Paul','28/1/79'],
+      ['2','23','Jimmy','13/6/95'],
+      ['3','36','Jane','17/9/80'],
+      ['4','N/A','Judy','19/4/83'],
+    ]
+    state = InferenceState(data[0])
+    state.update(data[1:3])
+    other = InferenceState(data[0]).update(iter(data[3:]))
+    other = InferenceState.from_dict(json.loads(json.dumps(other.to_dict())))
+    state.merge(other)
+    assert state.row_count == 4
+    assert state.to_descriptor() == Schema().infer(deepcopy(data))
+    assert state.to_descriptor(confidence=1)['fields'][1]['type'] == 'string'
+
+
+def test_inference_state_merge_different_headers():
+    state = InferenceState(['id', 'name'])
+    with pytest.raises(exceptions.TableSchemaException) as excinfo:
+        state.merge(InferenceState(['id']))
+    assert 'different headers' in str(excinfo.value)
+
+
 def test_schema_infer_with_non_headers_issues_goodtables_258():
     schema = Schema()
     schema.infer([[1],[2],[3]], headers=[None])
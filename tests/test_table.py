@@ -4,12 +4,17 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import io
 import six
+import random
 import pytest
 from collections import OrderedDict
 from copy import deepcopy
+from functools import partial
 from mock import Mock, patch
-from tableschema import Schema, FailedCast, Table, Storage, exceptions
+from tableschema import Schema, FailedCast, Table, Storage, ForeignKeyIndex, exceptions
+from tableschema.unique import DiskUniqueChecker
+from tableschema import config
 
 
 # General
@@ -76,6 +81,70 @@ def test_schema_infer_missing_values():
     ]
 
 
+def test_schema_infer_whole_table(tmpdir):
+    source = str(tmpdir.join('table.csv'))
+    with io.open(source, 'w', encoding='utf-8') as file:
+        file.write('id,code\n')
+        for index in range(150):
+            file.write('%s,%s\n' % (index, index))
+        file.write('150,A150\n')
+    table = Table(source)
+    assert table.infer()['fields'][1]['type'] == 'integer'
+    table = Table(source)
+    table.infer(limit=None, confidence=1)
+    assert table.schema.descriptor['fields'] == [
+        {'name': 'id', 'type': 'integer', 'format': 'default'},
+        {'name': 'code', 'type': 'string', 'format': 'default'},
+    ]
+    assert len(table.read()) == 151
+
+
+@pytest.mark.parametrize('sample, type', [
+    ('head', 'integer'),
+    ('reservoir', 'string'),
+    ('stride', 'string'),
+])
+def test_schema_infer_sample(tmpdir, sample, type):
+    source = str(tmpdir.join('table.csv'))
+    with io.open(source, 'w', encoding='utf-8') as file:
+        file.write('id,code\n')
+        for index in range(300):
+            file.write('%s,%s%s\n' % (index, 'A' if index >= 250 else '', index))
+    table = Table(source)
+    table.infer(limit=100, confidence=1, sample=sample)
+    assert table.schema.descriptor['fields'][1]['type'] == type
+    assert len(table.read(cast=False)) == 300
+
+
+def test_schema_infer_sample_reservoir_seed(tmpdir):
+    source = str(tmpdir.join('table.csv'))
+    with io.open(source, 'w', encoding='utf-8') as file:
+        file.write('id,code\n')
+        for index in range(300):
+            file.write('%s,%s\n' % (index, 'A' if index % 30 == 0 else index))
+    def infer_type(seed):
+        table = Table(source)
+        table.infer(limit=10, confidence=1, sample='reservoir', seed=seed)
+        return table.schema.descriptor['fields'][1]['type']
+    types = [infer_type(seed) for seed in range(20)]
+    assert set(types) == {'integer', 'string'}
+    assert [infer_type(seed) for seed in range(20)] == types
+    assert [infer_type(random.Random(seed)) for seed in range(20)] == types
+
+
+def test_schema_infer_workers():
+    table = Table('data/data_infer.csv')
+    table.infer(workers=2)
+    assert table.schema.descriptor == SCHEMA_CSV
+
+
+def test_schema_infer_sample_not_supported():
+    table = Table('data/data_infer.csv')
+    with pytest.raises(exceptions.TableSchemaException) as excinfo:
+        table.infer(sample='bad')
+    assert 'Not supported sample strategy' in str(excinfo.value)
+
+
 def test_infer_schema_empty_file():
     s = Table('data/empty.csv')
     d = s.infer()
@@ -335,6 +404,363 @@ def test_read_invalid_col_value_no_cast():
     assert actual == expect
 
 
+# Batch casting
+
+def test_read_batch_size():
+    table = Table('data/data_infer.csv', schema=SCHEMA_CSV, batch_size=2)
+    assert table.read() == [
+        [1, 39, 'Paul'],
+        [2, 23, 'Jimmy'],
+        [3, 36, 'Jane'],
+        [4, 28, 'Judy'],
+    ]
+
+
+def test_read_batch_size_handled():
+    source = [
+        ['key', 'value'],
+        ['one', 'not_an_int'],
+        ['two', ],
+        ['three', 3],
+    ]
+    errors = []
+    def handler(exc, row_number, row_data, error_data):
+        errors.append((exc, row_number, row_data, error_data))
+    table = Table(source, schema=SCHEMA_MIN, batch_size=10)
+    actual = table.read(exc_handler=handler)
+    assert actual == [['one', 'not_an_int'], ['two', None], ['three', 3]]
+    assert isinstance(actual[0][1], FailedCast)
+    assert [error[1] for error in errors] == [2, 3]
+    assert 'There are 1 cast errors' in str(errors[0][0])
+    assert 'Row length' in str(errors[1][0])
+
+
+def test_read_batch_size_errors_order():
+    schema = deepcopy(SCHEMA_CSV)
+    schema['primaryKey'] = 'id'
+    source = [
+        ['id', 'age', 'name'],
+        [1, 39, 'Paul'],
+        [1, 36, 'Jane'],
+        [2, 'bad', 'Judy'],
+    ]
+    errors = []
+    def handler(exc, row_number, row_data, error_data):
+        errors.append((row_number, type(exc)))
+    Table(source, schema=schema, batch_size=10).read(exc_handler=handler)
+    assert errors == [(3, exceptions.UniqueKeyError), (4, exceptions.CastError)]
+    rows = Table(source, schema=schema, batch_size=10).iter()
+    assert next(rows) == [1, 39, 'Paul']
+    with pytest.raises(exceptions.UniqueKeyError):
+        next(rows)
+
+
+def test_iter_batches():
+    table = Table('data/data_infer.csv', schema=SCHEMA_CSV)
+    batches = list(table.iter_batches(batch_size=3))
+    assert batches == [
+        {
+            'row_numbers': [2, 3, 4],
+            'columns': OrderedDict([
+                ('id', [1, 2, 3]),
+                ('age', [39, 23, 36]),
+                ('name', ['Paul', 'Jimmy', 'Jane']),
+            ]),
+            'errors': [False, False, False],
+        },
+        {
+            'row_numbers': [5],
+            'columns': OrderedDict([('id', [4]), ('age', [28]), ('name', ['Judy'])]),
+            'errors': [False],
+        },
+    ]
+
+
+def test_iter_batches_handled():
+    schema = deepcopy(SCHEMA_CSV)
+    schema['primaryKey'] = 'id'
+    source = [
+        ['id', 'age', 'name'],
+        [1, 39, 'Paul'],
+        [1, 36, 'Jane'],
+        [2, 'bad', 'Judy'],
+    ]
+    errors = []
+    def handler(exc, row_number, row_data, error_data):
+        errors.append((exc, row_number, row_data, error_data))
+    table = Table(source, schema=schema)
+    batches = list(table.iter_batches(batch_size=2, exc_handler=handler))
+    assert [batch['errors'] for batch in batches] == [[False, True], [True]]
+    assert isinstance(errors[0][0], exceptions.UniqueKeyError)
+    assert isinstance(batches[1]['columns']['age'][0], FailedCast)
+
+
+def test_read_dictionary_encode(tmpdir, monkeypatch):
+    source = str(tmpdir.join('table.csv'))
+    with io.open(source, 'w', encoding='utf-8') as file:
+        file.write('id,kind,name\n')
+        for index in range(6):
+            file.write('%s,%s,name%s\n' % (index, 'ab'[index % 2], index))
+    schema = {'fields': [
+        {'name': 'id', 'type': 'integer'},
+        {'name': 'kind', 'type': 'string'},
+        {'name': 'name', 'type': 'string'},
+    ]}
+    monkeypatch.setattr(config, 'DEFAULT_DICTIONARY_SIZE', 3)
+    rows = Table(source, schema=schema).read(dictionary_encode=True)
+    assert rows == Table(source, schema=schema).read()
+    assert rows[0][1] is rows[2][1] is rows[4][1]
+    assert rows[1][1] is rows[3][1] is rows[5][1]
+
+
+def test_read_dictionary_encode_not_strings():
+    source = [['value'], ['1.0'], ['1.00'], ['1.0']]
+    schema = {'fields': [
+        {'name': 'value', 'type': 'number', 'constraints': {'enum': ['1']}},
+    ]}
+    rows = Table(source, schema=schema).read(dictionary_encode=True)
+    assert [str(row[0]) for row in rows] == ['1.0', '1.00', '1.0']
+    batches = list(Table(source, schema=schema).iter_batches(dictionary_encode='codes'))
+    assert [str(value) for value in batches[0]['columns']['value']] == ['1.0', '1.00', '1.0']
+    assert batches[0]['dictionaries'] == OrderedDict()
+
+
+def test_iter_batches_dictionary_encode_codes(monkeypatch):
+    source = [['id', 'kind', 'name']] + [
+        [index, ['a', 'b', None][index % 3], 'name%s' % index] for index in range(6)]
+    monkeypatch.setattr(config, 'DEFAULT_DICTIONARY_SIZE', 3)
+    table = Table(source, schema={'fields': [
+        {'name': 'id', 'type': 'integer'},
+        {'name': 'kind', 'type': 'string'},
+        {'name': 'name', 'type': 'string'},
+    ]})
+    batches = list(table.iter_batches(batch_size=3, dictionary_encode='codes'))
+    assert batches[0]['columns'] == OrderedDict([
+        ('id', [0, 1, 2]), ('kind', [0, 1, None]), ('name', [0, 1, 2])])
+    assert batches[1]['columns'] == OrderedDict([
+        ('id', [3, 4, 5]), ('kind', [0, 1, None]), ('name', ['name3', 'name4', 'name5'])])
+    assert batches[0]['dictionaries'] == OrderedDict([
+        ('kind', ['a', 'b']), ('name', ['name0', 'name1', 'name2'])])
+    assert batches[1]['dictionaries'] == OrderedDict([('kind', ['a', 'b'])])
+
+
+def test_iter_batches_unique_violation():
+    schema = deepcopy(SCHEMA_CSV)
+    schema['primaryKey'] = 'id'
+    source = [
+        ['id', 'age', 'name'],
+        [1, 39, 'Paul'],
+        [1, 36, 'Jane'],
+    ]
+    table = Table(source, schema=schema)
+    with pytest.raises(exceptions.UniqueKeyError):
+        list(table.iter_batches())
+
+
+# Parallel casting
+
+def test_read_workers():
+    table = Table('data/data_infer.csv', schema=SCHEMA_CSV, batch_size=2)
+    assert table.read(workers=2) == [
+        [1, 39, 'Paul'],
+        [2, 23, 'Jimmy'],
+        [3, 36, 'Jane'],
+        [4, 28, 'Judy'],
+    ]
+
+
+def test_read_workers_handled():
+    schema = deepcopy(SCHEMA_CSV)
+    schema['primaryKey'] = 'id'
+    source = [
+        ['id', 'age', 'name'],
+        [1, 39, 'Paul'],
+        [1, 36, 'Jane'],
+        [2, 'bad', 'Judy'],
+    ]
+    errors = []
+    def handler(exc, row_number, row_data, error_data):
+        errors.append((exc, row_number, row_data, error_data))
+    table = Table(source, schema=schema)
+    rows = table.read(exc_handler=handler, workers=2)
+    assert rows == [[1, 39, 'Paul'], [1, 36, 'Jane'], [2, 'bad', 'Judy']]
+    assert isinstance(rows[2][1], FailedCast)
+    assert [error[1] for error in errors] == [3, 4]
+    assert isinstance(errors[0][0], exceptions.UniqueKeyError)
+    assert 'There are 1 cast errors' in str(errors[1][0])
+    assert len(errors[1][0].errors) == 1
+
+
+def test_read_workers_uncommitted_schema():
+    schema = Schema(SCHEMA_MIN)
+    schema.descriptor['fields'][1]['type'] = 'string'
+    table = Table([['key', 'value'], ['one', '7']], schema=schema)
+    assert table.read(workers=2) == table.read() == [['one', 7]]
+
+
+def test_read_workers_invalid_col_value():
+    source = [
+        ['key', 'value'],
+        ['one', 'not_an_int'],
+        ['two', 2],
+    ]
+    table = Table(source, schema=SCHEMA_MIN)
+    with pytest.raises(exceptions.CastError) as excinfo:
+        table.read(workers=2)
+    assert 'There are 1 cast errors' in str(excinfo.value)
+
+
+# Unique checks
+
+def test_read_unique_check_disk_handled():
+    schema = deepcopy(SCHEMA_CSV)
+    schema['primaryKey'] = 'id'
+    source = [
+        ['id', 'age', 'name'],
+        [1, 39, 'Paul'],
+        [1, 36, 'Jane'],
+        [2, 28, 'Judy'],
+    ]
+    errors = []
+    def handler(exc, row_number, row_data, error_data):
+        errors.append((exc, row_number, row_data, error_data))
+    table = Table(source, schema=schema)
+    rows = table.read(exc_handler=handler, unique_check='disk')
+    assert len(rows) == 3
+    assert len(errors) == 1
+    assert isinstance(errors[0][0], exceptions.UniqueKeyError)
+    assert errors[0][1] == 3
+
+
+@pytest.mark.parametrize('unique_check', ['memory', 'disk', 'bloom'])
+def test_read_unique_check_equal_values(unique_check):
+    schema = {
+        'fields': [
+            {'name': 'value', 'type': 'number', 'constraints': {'unique': True}},
+            {'name': 'time', 'type': 'datetime', 'format': 'any',
+             'constraints': {'unique': True}},
+        ],
+    }
+    source = [
+        ['value', 'time'],
+        ['0', '2020-01-01T10:00:00+00:00'],
+        ['-0', '2020-01-01T11:00:00+01:00'],
+    ]
+    errors = []
+    def handler(exc, row_number, row_data, error_data):
+        errors.append((exc, row_number, row_data, error_data))
+    table = Table(source, schema=schema)
+    table.read(exc_handler=handler, unique_check=unique_check)
+    assert len(errors) == 2
+    assert all(isinstance(error[0], exceptions.UniqueKeyError) for error in errors)
+    assert [error[1] for error in errors] == [3, 3]
+
+
+def test_read_unique_check_custom_checker():
+    schema = deepcopy(SCHEMA_CSV)
+    schema['primaryKey'] = 'id'
+    source = [
+        ['id', 'age', 'name'],
+        [1, 39, 'Paul'],
+        [2, 36, 'Jane'],
+        [1, 28, 'Judy'],
+    ]
+    errors = []
+    def handler(exc, row_number, row_data, error_data):
+        errors.append((exc, row_number, row_data, error_data))
+    checker = partial(DiskUniqueChecker, buffer_size=1)
+    table = Table(source, schema=schema)
+    rows = table.read(exc_handler=handler, unique_check=checker)
+    assert len(rows) == 3
+    assert [(error[1], error[2]) for error in errors] == [(4, None)]
+    assert isinstance(errors[0][0], exceptions.UniqueKeyError)
+
+
+@pytest.mark.parametrize('unique_check', ['memory', 'disk', 'bloom'])
+def test_read_unique_check_failed_casts(unique_check):
+    schema = {'fields': [{'name': 'id', 'type': 'integer'}], 'primaryKey': 'id'}
+    source = [['id'], ['bad'], ['1'], ['bad'], ['1']]
+    errors = []
+    def handler(exc, row_number, row_data, error_data):
+        errors.append((type(exc), row_number))
+    table = Table(source, schema=schema)
+    table.read(exc_handler=handler, unique_check=unique_check)
+    assert sorted(errors, key=lambda error: error[1]) == [
+        (exceptions.CastError, 2),
+        (exceptions.CastError, 4),
+        (exceptions.UniqueKeyError, 5),
+    ]
+
+
+def test_read_unique_check_deferred_error_data():
+    schema = deepcopy(SCHEMA_CSV)
+    schema['primaryKey'] = ['id', 'name']
+    source = [
+        ['id', 'age', 'name'],
+        [1, 39, 'Paul'],
+        [2, 36, 'Jane'],
+        [1, 28, 'Paul'],
+    ]
+    errors = []
+    def handler(exc, row_number, row_data, error_data):
+        errors.append((exc, row_number, row_data, error_data))
+    checker = partial(DiskUniqueChecker, buffer_size=1)
+    table = Table(source, schema=schema)
+    table.read(exc_handler=handler, unique_check=checker)
+    assert [(error[1], error[2], error[3]) for error in errors] == [
+        (4, None, {'id': 1, 'name': 'Paul'})]
+    assert 'for values (1, \'Paul\')' in str(errors[0][0])
+
+
+def test_read_unique_check_bloom_handled():
+    schema = deepcopy(SCHEMA_CSV)
+    schema['primaryKey'] = 'id'
+    source = [
+        ['id', 'age', 'name'],
+        [1, 39, 'Paul'],
+        [2, 36, 'Jane'],
+        [1, 28, 'Judy'],
+        [1, 28, 'John'],
+    ]
+    errors = []
+    def handler(exc, row_number, row_data, error_data):
+        errors.append((exc, row_number, row_data, error_data))
+    table = Table(source, schema=schema)
+    rows = table.read(exc_handler=handler, unique_check='bloom')
+    assert len(rows) == 4
+    assert [(error[1], error[2] is None) for error in errors] == [(5, False), (4, True)]
+    assert isinstance(errors[1][0], exceptions.UniqueKeyError)
+
+
+@pytest.mark.parametrize('unique_check', ['memory', 'disk', 'bloom'])
+def test_read_unique_check_list_source_longer_than_sample(unique_check):
+    schema = {'fields': [{'name': 'id', 'type': 'integer'}], 'primaryKey': 'id'}
+    source = [['id']] + [[number % 100] for number in range(250)]
+    errors = []
+    def handler(exc, row_number, row_data, error_data):
+        errors.append(row_number)
+    table = Table(source, schema=schema)
+    rows = table.read(exc_handler=handler, unique_check=unique_check)
+    assert len(rows) == 250
+    assert sorted(errors) == list(range(102, 252))
+    assert len(table.read(exc_handler=handler)) == 250
+
+
+def test_read_unique_check_bloom_stream_source():
+    schema = {'fields': [{'name': 'id', 'type': 'integer'}], 'primaryKey': 'id'}
+    table = Table(io.BytesIO(b'id\n1\n2\n1\n'), format='csv', schema=schema)
+    with pytest.raises(exceptions.TableSchemaException) as excinfo:
+        table.read(unique_check='bloom')
+    assert 'can be read twice' in str(excinfo.value)
+
+
+def test_read_unique_check_not_supported():
+    table = Table('data/data_infer.csv', schema=SCHEMA_CSV)
+    with pytest.raises(exceptions.TableSchemaException) as excinfo:
+        table.read(unique_check='bad')
+    assert 'Not supported unique check' in str(excinfo.value)
+
+
 # Stats/integrity
 
 SIZE = 63
@@ -524,6 +950,121 @@ def test_iter_single_field_foreign_key_invalid():
 
 
 
+def test_single_field_foreign_key_index():
+    index = ForeignKeyIndex(FK_RELATIONS['people'], ['firstname'])
+    table = Table(FK_SOURCE, schema=FK_SCHEMA)
+    rows = table.read(relations=True, foreign_keys_values={'people': index})
+    assert rows == [
+      ['1', {'firstname': 'Alex', 'surname': 'Martin'}, 'Martin'],
+      ['2', {'firstname': 'John', 'surname': 'Dockins'}, 'Dockins'],
+      ['3', {'firstname': 'Walter', 'surname': 'White'}, 'White'],
+    ]
+
+
+def test_single_field_foreign_key_index_invalid(tmpdir):
+    path = str(tmpdir.join('index.db'))
+    relations = deepcopy(FK_RELATIONS)
+    relations['people'][2]['firstname'] = 'Max'
+    ForeignKeyIndex(relations['people'], ['firstname']).save(path)
+    index = ForeignKeyIndex.load(path)
+    table = Table(FK_SOURCE, schema=FK_SCHEMA)
+    with pytest.raises(exceptions.UnresolvedFKError) as excinfo:
+        table.read(relations=True, foreign_keys_values={'people': index})
+    assert 'Foreign key' in str(excinfo.value)
+
+
+def test_single_field_foreign_key_index_single_lookup():
+    index = ForeignKeyIndex(FK_RELATIONS['people'], ['firstname'])
+    with patch.object(ForeignKeyIndex, 'get', wraps=index.get) as get:
+        with patch.object(ForeignKeyIndex, '__contains__') as contains:
+            table = Table(FK_SOURCE, schema=FK_SCHEMA)
+            table.read(relations=True, foreign_keys_values={'people': index})
+    assert get.call_count == 3
+    assert contains.call_count == 0
+
+
+def test_single_field_foreign_key_relations_table():
+    people = Table([
+        ['firstname', 'surname'],
+        ['Alex', 'Martin'],
+        ['John', 'Dockins'],
+        ['Walter', 'White'],
+    ])
+    table = Table(FK_SOURCE, schema=FK_SCHEMA)
+    rows = table.read(relations={'people': people})
+    assert rows == [
+      ['1', {'firstname': 'Alex', 'surname': 'Martin'}, 'Martin'],
+      ['2', {'firstname': 'John', 'surname': 'Dockins'}, 'Dockins'],
+      ['3', {'firstname': 'Walter', 'surname': 'White'}, 'White'],
+    ]
+
+
+def test_single_field_foreign_key_relations_storage_invalid():
+    storage = Mock(
+        describe=Mock(return_value={
+            'fields': [{'name': 'firstname'}, {'name': 'surname'}]}),
+        iter=Mock(return_value=[['Alex', 'Martin'], ['John', 'Dockins']]),
+        spec=Storage,
+    )
+    table = Table(FK_SOURCE, schema=FK_SCHEMA)
+    with pytest.raises(exceptions.UnresolvedFKError) as excinfo:
+        table.read(relations={'people': storage})
+    assert 'Foreign key' in str(excinfo.value)
+    storage.describe.assert_called_with('people')
+
+
+def test_single_field_foreign_key_merge():
+    relations = {'people': sorted(
+        FK_RELATIONS['people'] + [{'firstname': 'Bob', 'surname': 'Smith'}],
+        key=lambda row: row['firstname'])}
+    table = Table(FK_SOURCE, schema=FK_SCHEMA)
+    rows = table.read(relations=relations, relations_strategy='merge')
+    assert rows == [
+      ['1', {'firstname': 'Alex', 'surname': 'Martin'}, 'Martin'],
+      ['2', {'firstname': 'John', 'surname': 'Dockins'}, 'Dockins'],
+      ['3', {'firstname': 'Walter', 'surname': 'White'}, 'White'],
+    ]
+
+
+def test_single_field_foreign_key_merge_invalid_handled():
+    relations = deepcopy(FK_RELATIONS)
+    relations['people'][1]['firstname'] = 'Bob'
+    errors = []
+    def handler(exc, row_number, row_data, error_data):
+        errors.append((exc, row_number, row_data, error_data))
+    table = Table(FK_SOURCE, schema=FK_SCHEMA)
+    rows = table.read(relations={'people': Table(relations['people'])},
+                      relations_strategy='merge', exc_handler=handler)
+    assert rows[2] == ['3', {'firstname': 'Walter', 'surname': 'White'}, 'White']
+    assert [error[1] for error in errors] == [3]
+    assert isinstance(errors[0][0], exceptions.UnresolvedFKError)
+
+
+def test_single_field_foreign_key_merge_table_not_sorted():
+    source = [FK_SOURCE[0], FK_SOURCE[2], FK_SOURCE[1]]
+    table = Table(source, schema=FK_SCHEMA)
+    with pytest.raises(exceptions.RelationError) as excinfo:
+        table.read(relations=FK_RELATIONS, relations_strategy='merge')
+    assert 'Table is not sorted' in str(excinfo.value)
+
+
+def test_single_field_foreign_key_merge_reference_not_sorted():
+    relations = deepcopy(FK_RELATIONS)
+    relations['people'][1], relations['people'][2] = relations['people'][2], relations['people'][1]
+    source = [FK_SOURCE[0], FK_SOURCE[3], ['4', 'Zed', 'Zed']]
+    table = Table(source, schema=FK_SCHEMA)
+    with pytest.raises(exceptions.RelationError) as excinfo:
+        table.read(relations=relations, relations_strategy='merge')
+    assert 'Reference "people" is not sorted' in str(excinfo.value)
+
+
+def test_relations_strategy_not_supported():
+    table = Table(FK_SOURCE, schema=FK_SCHEMA)
+    with pytest.raises(exceptions.TableSchemaException) as excinfo:
+        table.read(relations=FK_RELATIONS, relations_strategy='bad')
+    assert 'Not supported relations strategy' in str(excinfo.value)
+
+
 MULTI_FK_SOURCE = [
   ['id', 'name', 'surname'],
   ['1', 'Alex', 'Martin'],
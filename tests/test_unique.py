@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+from decimal import Decimal
+from datetime import datetime, time, timedelta, timezone
+from tableschema.unique import MemoryUniqueChecker, DiskUniqueChecker, BloomUniqueChecker
+from tableschema.unique import create_key_digest
+
+
+# Constants
+
+UTC_PLUS_ONE = timezone(timedelta(hours=1))
+
+
+# Tests
+
+def test_memory_unique_checker():
+    checker = MemoryUniqueChecker()
+    assert checker.add((1,), 2) is False
+    assert checker.add((2,), 3) is False
+    assert checker.add((1,), 4) is True
+    assert checker.close() == []
+
+
+def test_memory_unique_checker_hash_collision():
+    checker = MemoryUniqueChecker()
+    assert hash((-1,)) == hash((-2,))
+    assert checker.add((-1,), 2) is False
+    assert checker.add((-2,), 3) is False
+    assert checker.add((-2,), 4) is True
+
+
+def test_memory_unique_checker_resize():
+    checker = MemoryUniqueChecker(capacity=4)
+    assert not any(checker.add((value, 'a'), value) for value in range(100))
+    assert all(checker.add((value, 'a'), value) for value in range(100))
+
+
+def test_memory_unique_checker_not_hashable_values():
+    checker = MemoryUniqueChecker()
+    assert checker.add(({'a': 1, 'b': 2},), 2) is False
+    assert checker.add(({'b': 2, 'a': 1},), 3) is True
+    assert checker.add(([1, 2],), 4) is False
+
+
+def test_memory_unique_checker_decimal_values():
+    checker = MemoryUniqueChecker()
+    assert checker.add((Decimal('1.0'),), 2) is False
+    assert checker.add((Decimal('1.00'),), 3) is True
+
+
+def test_memory_unique_checker_equal_values():
+    checker = MemoryUniqueChecker()
+    assert checker.add((Decimal('0'),), 2) is False
+    assert checker.add((Decimal('-0'),), 3) is True
+    assert checker.add((-0.0,), 4) is True
+    assert checker.add((0.5,), 5) is False
+    assert checker.add((datetime(2020, 1, 1, 10, tzinfo=timezone.utc),), 6) is False
+    assert checker.add((datetime(2020, 1, 1, 11, tzinfo=UTC_PLUS_ONE),), 7) is True
+    assert checker.add((datetime(2020, 1, 1, 10),), 8) is False
+
+
+def test_memory_unique_checker_not_serializable_values():
+    checker = MemoryUniqueChecker()
+    key = (lambda: None,)
+    assert checker.add(key, 2) is False
+    assert checker.add(key, 3) is True
+
+
+def test_disk_unique_checker():
+    checker = DiskUniqueChecker(buffer_size=2)
+    duplicates = [checker.add((value,), row_number)
+                  for row_number, value in enumerate([1, 2, 1, 3, 3, 2, 4], start=2)]
+    assert duplicates == [False, False, False, False, False, False, False]
+    assert checker.close() == [(4, (1,)), (6, (3,)), (7, (2,))]
+
+
+def test_disk_unique_checker_spilled_keys():
+    keys = [(Decimal('1.0'), 'a'), (Decimal('1.00'), 'a'), ({'a': [1]}, None)]
+    checker = DiskUniqueChecker(buffer_size=1)
+    for row_number, key in enumerate(keys + keys[2:], start=2):
+        assert checker.add(key, row_number) is False
+    assert checker.close() == [(3, keys[1]), (5, keys[2])]
+
+
+def test_disk_unique_checker_no_spill():
+    checker = DiskUniqueChecker()
+    assert checker.add(('a', 1), 2) is False
+    assert checker.add(('a', 1), 3) is True
+    assert checker.close() == []
+
+
+def test_disk_unique_checker_equal_values():
+    checker = DiskUniqueChecker()
+    assert checker.add((Decimal('0'),), 2) is False
+    assert checker.add((Decimal('-0'),), 3) is True
+    assert checker.add((datetime(2020, 1, 1, 10, tzinfo=timezone.utc),), 4) is False
+    assert checker.add((datetime(2020, 1, 1, 11, tzinfo=UTC_PLUS_ONE),), 5) is True
+    assert checker.add((time(10, tzinfo=timezone.utc),), 6) is False
+    assert checker.add((time(11, tzinfo=UTC_PLUS_ONE),), 7) is True
+    assert checker.add((time(0, 30, tzinfo=UTC_PLUS_ONE),), 8) is False
+    assert checker.add((time(23, 30, tzinfo=timezone.utc),), 9) is False
+    assert checker.close() == []
+
+
+def test_bloom_unique_checker():
+    values = [1, 2, 1, 3, 1, 4]
+    keys = [((value,), row_number) for row_number, value in enumerate(values, start=2)]
+    checker = BloomUniqueChecker()
+    duplicates = [checker.add(key, row_number) for key, row_number in keys]
+    assert duplicates == [False, False, False, False, True, False]
+    assert checker.close(lambda: iter(keys)) == [(4, (1,))]
+
+
+def test_bloom_unique_checker_false_positives():
+    keys = [((value,), row_number) for row_number, value in enumerate(range(1000), start=2)]
+    checker = BloomUniqueChecker(capacity=10, error_rate=0.5)
+    assert not any(checker.add(key, row_number) for key, row_number in keys)
+    assert checker.close(lambda: iter(keys)) == []
+
+
+def test_bloom_unique_checker_suspects_overflow():
+    values = [1, 2, 1, 3, 1, 2, 3, 4]
+    keys = [((value,), row_number) for row_number, value in enumerate(values, start=2)]
+    checker = BloomUniqueChecker(suspects_size=1)
+    duplicates = [checker.add(key, row_number) for key, row_number in keys]
+    assert duplicates == [False, False, False, False, True, False, False, False]
+    assert checker.close(lambda: iter(keys)) == [(4, (1,)), (7, (2,)), (8, (3,))]
+
+
+def test_create_key_digest():
+    assert len(create_key_digest((1, 'a'))) == 16
+    assert create_key_digest((Decimal('1.0'),)) == create_key_digest((Decimal('1.00'),))
+    assert create_key_digest(({'a': 1, 'b': 2},)) == create_key_digest(({'b': 2, 'a': 1},))
+    assert create_key_digest((1,)) != create_key_digest(('1',))
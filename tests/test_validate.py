@@ -8,7 +8,7 @@ import os
 import io
 import json
 import pytest
-from tableschema import validate, exceptions
+from tableschema import Schema, validate, validate_tables, exceptions
 
 
 # Tests
@@ -108,3 +108,61 @@ def test_validate_error_message():
     assert 'at "fields/0" in descriptor' in message
     assert 'at "properties/fields/items/anyOf" in profile' in message
 
+
+# Tables
+
+def test_validate_tables():
+    tables = [
+        ('data/data_infer.csv', {'fields': [
+            {'name': 'id', 'type': 'integer'},
+            {'name': 'age', 'type': 'integer'},
+            {'name': 'name', 'type': 'string'},
+        ]}),
+        ('data/data_infer.csv', {'fields': [
+            {'name': 'id', 'type': 'integer'},
+            {'name': 'age', 'type': 'integer'},
+            {'name': 'name', 'type': 'integer'},
+        ]}),
+        ('data/bad_path.csv', {'fields': [{'name': 'id'}]}),
+    ]
+    reports = sorted(validate_tables(tables, workers=2), key=lambda report: report['index'])
+    assert [report['index'] for report in reports] == [0, 1, 2]
+    assert [report['source'] for report in reports] == [table[0] for table in tables]
+    assert reports[0]['valid'] is True
+    assert reports[0]['errors'] == []
+    assert reports[1]['valid'] is False
+    assert reports[1]['row_count'] == 4
+    assert len(reports[1]['errors']) == 4
+    assert reports[1]['errors'][0]['row_number'] == 2
+    assert reports[1]['errors'][0]['type'] == 'CastError'
+    assert 'can\'t cast value "Paul"' in reports[1]['errors'][0]['message']
+    assert reports[2]['valid'] is False
+    assert reports[2]['errors'][0]['row_number'] is None
+
+
+def test_validate_tables_in_process():
+    tables = [([['id'], ['1'], ['1']], {'fields': [{'name': 'id'}], 'primaryKey': 'id'})]
+    reports = list(validate_tables(tables, workers=1))
+    assert len(reports) == 1
+    assert reports[0]['valid'] is False
+    assert reports[0]['errors'][0]['type'] == 'UniqueKeyError'
+    assert reports[0]['errors'][0]['row_number'] == 3
+
+
+def test_validate_tables_schema_file_changed(tmpdir):
+    path = str(tmpdir.join('schema.json'))
+    tables = [([['id'], ['a']], path)]
+    with io.open(path, 'w') as file:
+        file.write(json.dumps({'fields': [{'name': 'id', 'type': 'integer'}]}))
+    assert list(validate_tables(tables, workers=1))[0]['valid'] is False
+    with io.open(path, 'w') as file:
+        file.write(json.dumps({'fields': [{'name': 'id', 'type': 'string'}]}))
+    assert list(validate_tables(tables, workers=1))[0]['valid'] is True
+
+
+def test_validate_tables_uncommitted_schema():
+    schema = Schema({'fields': [{'name': 'id', 'type': 'integer'}]})
+    schema.descriptor['fields'][0]['type'] = 'string'
+    tables = [([['id'], ['a']], schema)]
+    assert list(validate_tables(tables, workers=1))[0]['valid'] is False
+    assert list(validate_tables(tables, workers=2))[0]['valid'] is False
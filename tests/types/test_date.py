@@ -26,6 +26,8 @@ from tableschema.config import ERROR
     ('any', '2019-01-01', date(2019, 1, 1)),
     ('any', '10th Jan 1969', date(1969, 1, 10)),
     ('any', '10th Jan nineteen sixty nine', ERROR),
+    ('any', '2019-1-1', date(2019, 1, 1)),
+    ('any', '2019-02-30', ERROR),
     ('any', 'invalid', ERROR),
     ('any', True, ERROR),
     ('any', '', ERROR),
@@ -48,3 +50,4 @@ def test_cast_date(format, value, result):
     with warnings.catch_warnings():
         warnings.simplefilter("error" if not format.startswith('fmt:') else "ignore")
         assert types.cast_date(format, value) == result
+        assert types.compile_date(format)(value) == result
@@ -44,3 +44,4 @@ def test_cast_datetime(format, value, result):
     with warnings.catch_warnings():
         warnings.simplefilter("error" if not format.startswith('fmt:') else "ignore")
         assert types.cast_datetime(format, value) == result
+        assert types.compile_datetime(format)(value) == result
@@ -5,6 +5,7 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 import pytest
+import itertools
 from decimal import Decimal
 from tableschema import types
 from tableschema.config import ERROR
@@ -51,6 +52,50 @@ from tableschema.config import ERROR
     ('default', '$10:000.00', ERROR, {}),
     ('default', 'string', ERROR, {}),
     ('default', '', ERROR, {}),
+    ('default', '10.50', 10.5, {'floatNumber': True}),
+    ('default', ' -1e3 ', -1000.0, {'floatNumber': True}),
+    ('default', '1 000', 1000.0, {'floatNumber': True}),
+    ('default', 1, 1.0, {'floatNumber': True}),
+    ('default', Decimal('0.5'), 0.5, {'floatNumber': True}),
+    ('default', '10.000,50', 10000.5, {'floatNumber': True, 'groupChar': '.', 'decimalChar': ','}),
+    ('default', '1,5', 1.5, {'floatNumber': True, 'decimalChar': ','}),
+    ('default', '1.5$', 1.5, {'floatNumber': True, 'bareNumber': False}),
+    ('default', 'string', ERROR, {'floatNumber': True}),
+    ('default', True, ERROR, {'floatNumber': True}),
+    ('default', '1.5', Decimal(15), {'groupChar': '.'}),
+    ('default', '1..2', Decimal(12), {'groupChar': '.'}),
+    ('default', '1,5', Decimal('1.5'), {'groupChar': ',', 'decimalChar': ','}),
+    ('default', '1_000,5', Decimal('1000.5'), {'groupChar': '_', 'decimalChar': ','}),
+    ('default', '1_000', 1000.0, {'floatNumber': True}),
+    ('default', 10 ** 400, float('inf'), {'floatNumber': True}),
 ])
 def test_cast_number(format, value, result, options):
     assert types.cast_number(format, value, **options) == result
+    assert types.compile_number(format, **options)(value) == result
+
+
+def test_cast_number_float():
+    assert type(types.cast_number('default', '1.5', floatNumber=True)) is float
+    assert type(types.cast_number('default', '1 5', floatNumber=True)) is float
+
+
+@pytest.mark.parametrize('options', [
+    dict(zip(['groupChar', 'decimalChar', 'bareNumber', 'floatNumber'], values))
+    for values in itertools.product(
+        ['', ',', '.', ' ', '_'], ['.', ',', ' ', '_'], [True, False], [True, False])
+])
+def test_compile_number(options):
+    cast = types.compile_number('default', **options)
+    for value in COMPILE_VALUES:
+        expected = types.cast_number('default', value, **options)
+        # repr to compare NaNs
+        assert repr(cast(value)) == repr(expected), value
+
+
+COMPILE_VALUES = [
+    '', '1', '-1', '+1', '1.5', '1,5', '1 5', '1_5', '1..2', '1,,2', '.5', ',5', '5.',
+    '1.000,5', '1,000.5', '1 000,5', '1_000.5', ' 1 ', '\t-0\t', '-0', '1e5', '1E-5',
+    '1.5e3', '$1.5', '1.5%', '(1.5)', '1.5.', 'NaN', 'nan7', 'sNaN', 'inf', '-Infinity',
+    'string', 'e', '.', ',', '_', '1__0', '_1', '1_', 10 ** 400, 1, 1.5, -0.0,
+    Decimal('1.50'), Decimal('NaN'), True, None,
+]
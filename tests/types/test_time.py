@@ -52,3 +52,4 @@ def test_cast_time(format, value, result):
     with warnings.catch_warnings():
         warnings.simplefilter("error" if not format.startswith('fmt:') else "ignore")
         assert types.cast_time(format, value) == result
+        assert types.compile_time(format)(value) == result